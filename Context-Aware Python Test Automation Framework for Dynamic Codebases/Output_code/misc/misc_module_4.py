@@ -1,11 +1,15 @@
 class ConstraintScore:
     """Result of evaluating a single constraint"""
+    __slots__ = ("value", "reason")
+    
     def __init__(self, value, reason=""):
         self.value = max(0.0, min(1.0, value))  # Force between 0-1
         self.reason = reason
 
 class FusionResult:
     """Result of combining multiple constraint scores"""
+    __slots__ = ("value", "analysis")
+    
     def __init__(self, value, analysis=None):
         self.value = value
         self.analysis = analysis or {}
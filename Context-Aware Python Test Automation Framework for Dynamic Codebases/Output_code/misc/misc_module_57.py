@@ -3,6 +3,9 @@ class PersonaDissent:
     A record of a persona's dissent regarding a constraint override,
     including the specific objections and strength of dissent.
     """
+    __slots__ = ("persona_id", "persona_role", "dissent_score", "objections",
+                 "timestamp", "session_id", "persona_weight", "metadata")
+    
     def __init__(self, persona_id, persona_role, dissent_score, objections=None, metadata=None):
         self.persona_id = persona_id
         self.persona_role = persona_role
@@ -21,6 +24,22 @@ class PersonaDissent:
             "reason": reason
         })
         
+    def fast_clone(self):
+        """Create an independent copy without going through copy.deepcopy"""
+        clone = PersonaDissent.__new__(PersonaDissent)
+        clone.persona_id = self.persona_id
+        clone.persona_role = self.persona_role
+        clone.dissent_score = self.dissent_score
+        clone.objections = _clone(self.objections)
+        clone.timestamp = self.timestamp
+        clone.session_id = self.session_id
+        clone.persona_weight = self.persona_weight
+        clone.metadata = _clone(self.metadata)
+        return clone
+        
+    def __deepcopy__(self, memo):
+        return self.fast_clone()
+        
     def calculate_weight(self, role_hierarchy):
         """Calculate this dissent's weight based on role"""
         self.persona_weight = role_hierarchy.get_priority(self.persona_role)
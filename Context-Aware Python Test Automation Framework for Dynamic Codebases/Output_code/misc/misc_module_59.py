@@ -3,6 +3,9 @@ class SessionContext:
     Maintains information about the session context for a mutation,
     supporting cross-session tracking and decay calculations.
     """
+    __slots__ = ("session_id", "parent_session_ids", "session_depth",
+                 "hop_timestamps", "local_feedback_scores", "session_metadata")
+    
     def __init__(self):
         self.session_id = None  # Current session ID
         self.parent_session_ids = []  # Chain of parent sessions
@@ -18,6 +21,37 @@ class SessionContext:
         self.session_metadata = metadata or {}
         self.hop_timestamps = [time.time()]
         
+    def branch_from(self, parent):
+        """
+        Initialize as a snapshot of a parent context
+        The metadata dict and each feedback score list are copied, so later
+        writes on either side stay separate; the values inside them (metadata
+        values, individual feedback records) are shared, not deep-copied
+        """
+        self.session_id = parent.session_id
+        self.parent_session_ids = list(parent.parent_session_ids)
+        self.session_depth = parent.session_depth
+        self.hop_timestamps = list(parent.hop_timestamps)
+        self.local_feedback_scores = {
+            feedback_type: list(scores)
+            for feedback_type, scores in parent.local_feedback_scores.items()
+        }
+        self.session_metadata = dict(parent.session_metadata)
+        
+    def fast_clone(self):
+        """Create an independent copy without going through copy.deepcopy"""
+        clone = SessionContext.__new__(SessionContext)
+        clone.session_id = self.session_id
+        clone.parent_session_ids = list(self.parent_session_ids)
+        clone.session_depth = self.session_depth
+        clone.hop_timestamps = list(self.hop_timestamps)
+        clone.local_feedback_scores = _clone(self.local_feedback_scores)
+        clone.session_metadata = _clone(self.session_metadata)
+        return clone
+        
+    def __deepcopy__(self, memo):
+        return self.fast_clone()
+        
     def hop_to_new_session(self, new_session_id, metadata=None):
         """Record a hop to a new session"""
         if self.session_id:
@@ -57,4 +91,36 @@ class SessionContext:
             "hop_timestamps": self.hop_timestamps,
             "local_feedback": self.local_feedback_scores,
             "metadata": self.session_metadata
-        }
\ No newline at end of file
+        }
+
+
+def _clone_mapping(mapping):
+    return {key: _clone(value) for key, value in mapping.items()}
+
+
+def _clone_identity(value):
+    return value
+
+
+# Specialized deep-copy handlers for the plain data held by session and
+# dissent records; these contain no cycles, so no memo dict is needed
+_CLONE = {
+    dict: _clone_mapping,
+    list: lambda items: [_clone(item) for item in items],
+    tuple: lambda items: tuple(_clone(item) for item in items),
+    str: _clone_identity,
+    int: _clone_identity,
+    float: _clone_identity,
+    bool: _clone_identity,
+    type(None): _clone_identity,
+    PersonaDissent: PersonaDissent.fast_clone,
+    SessionContext: SessionContext.fast_clone,
+}
+
+
+def _clone(obj):
+    """Deep-copy known plain data types, deferring to copy.deepcopy otherwise"""
+    cloner = _CLONE.get(type(obj))
+    if cloner is None:
+        return copy.deepcopy(obj)
+    return cloner(obj)
\ No newline at end of file
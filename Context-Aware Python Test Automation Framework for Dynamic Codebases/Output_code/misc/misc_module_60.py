@@ -64,7 +64,7 @@ class DissentDecayManager:
         
         for report in dissent_reports:
             # Clone the report to avoid modifying the original
-            updated = copy.deepcopy(report)
+            updated = report.fast_clone()
             
             # Calculate and apply decay factor
             decay_factor = self.calculate_decay_factor(report, session_context)
@@ -7,6 +7,7 @@ class DissentRegistry:
         self.dissent_records = {}  # Maps mutation_id to list of dissent reports
         self.persona_history = {}  # Maps persona_id to dissent history
         self.session_records = {}  # Maps session_id to dissent summary
+        self.role_aggregates = {}  # Maps mutation_id to {role: [count, score_sum, reports]}
         self.decay_manager = decay_manager or DissentDecayManager()
         
     def register_dissent(self, mutation_id, dissent_report, session_context):
@@ -22,6 +23,15 @@ class DissentRegistry:
             self.dissent_records[mutation_id] = []
         self.dissent_records[mutation_id].append(dissent_report)
         
+        # Update running per-role aggregates for the mutation
+        by_role = self.role_aggregates.setdefault(mutation_id, {})
+        role_agg = by_role.get(dissent_report.persona_role)
+        if role_agg is None:
+            role_agg = by_role[dissent_report.persona_role] = [0, 0.0, []]
+        role_agg[0] += 1
+        role_agg[1] += dissent_report.dissent_score
+        role_agg[2].append(dissent_report)
+        
         # Add to persona history
         persona_id = dissent_report.persona_id
         if persona_id not in self.persona_history:
@@ -73,6 +83,20 @@ class DissentRegistry:
             
         return reports
         
+    def get_role_summary(self, mutation_id):
+        """
+        Get dissent for a mutation grouped by persona role
+        Built from the running aggregates, without rescanning reports
+        """
+        summary = {}
+        for role, (count, score_sum, reports) in self.role_aggregates.get(mutation_id, {}).items():
+            summary[role] = {
+                "count": count,
+                "average_score": score_sum / count if count > 0 else 0,
+                "reports": list(reports)
+            }
+        return summary
+        
     def get_persona_dissent_history(self, persona_id, limit=None):
         """Get dissent history for a specific persona"""
         if persona_id not in self.persona_history:
@@ -4,61 +4,85 @@ class SessionManager:
     preserving necessary state across session hops.
     """
     def __init__(self):
-        self.active_sessions = {}  # Maps session_id to SessionContext
-        self.session_lineage = {}  # Maps session_id to parent session_id
-        
+        # Sessions are stored as parallel arrays indexed by a dense session index
+        self._id_to_idx = {}  # Maps session_id to session index
+        self._session_ids = []  # session_id for each index
+        self._parents = []  # Parent session index for each index (-1 for roots)
+        self._contexts = []  # SessionContext for each index
+
+    def _add_session(self, session_id, context, parent_idx=-1):
+        """Append a session to the parallel arrays and return its index"""
+        idx = len(self._contexts)
+        self._id_to_idx[session_id] = idx
+        self._session_ids.append(session_id)
+        self._parents.append(parent_idx)
+        self._contexts.append(context)
+        return idx
+
+    @staticmethod
+    def _new_session_id():
+        """Generate a short random session ID (64 bits of entropy)"""
+        return secrets.token_hex(8)
+
     def create_session(self, metadata=None):
         """Create a new session context"""
-        session_id = str(uuid.uuid4())
+        session_id = self._new_session_id()
         context = SessionContext()
         context.initialize_session(session_id, metadata)
-        
-        self.active_sessions[session_id] = context
+
+        self._add_session(session_id, context)
         return session_id, context
-        
+
     def get_session_context(self, context=None):
         """Get session context from global context or create new"""
         if context and "session_id" in context:
-            session_id = context["session_id"]
-            if session_id in self.active_sessions:
-                return self.active_sessions[session_id]
-                
+            idx = self._id_to_idx.get(context["session_id"])
+            if idx is not None:
+                return self._contexts[idx]
+
         # Create new session
-        session_id, context = self.create_session(context.get("session_metadata") if context else None)
-        
+        session_id, session_context = self.create_session(context.get("session_metadata") if context else None)
+
         # Update global context if provided
-        if context:
+        if context is not None:
             context["session_id"] = session_id
-            
-        return context
-        
+
+        return session_context
+
     def hop_to_new_session(self, original_session_id, metadata=None):
         """
         Create a new session that hops from an existing one,
         preserving lineage
         """
-        if original_session_id not in self.active_sessions:
+        original_idx = self._id_to_idx.get(original_session_id)
+        if original_idx is None:
             return self.create_session(metadata)
-            
+
         # Create new session
-        new_session_id = str(uuid.uuid4())
-        
-        # Get original context and create new with hop
-        original_context = self.active_sessions[original_session_id]
-        new_context = copy.deepcopy(original_context)
+        new_session_id = self._new_session_id()
+
+        # Snapshot the original's containers instead of deep-copying it
+        new_context = SessionContext()
+        new_context.branch_from(self._contexts[original_idx])
         new_context.hop_to_new_session(new_session_id, metadata)
-        
-        # Record in active sessions
-        self.active_sessions[new_session_id] = new_context
-        
-        # Record lineage
-        self.session_lineage[new_session_id] = original_session_id
-        
+
+        # Record in active sessions, with lineage pointing at the original
+        self._add_session(new_session_id, new_context, parent_idx=original_idx)
+
         return new_session_id, new_context
-        
+
     def get_session_chain(self, session_id):
         """Get the chain of session lineage"""
-        if session_id not in self.active_sessions:
+        idx = self._id_to_idx.get(session_id)
+        if idx is None:
             return []
-            
-        return self.active_sessions[session_id].get_session_chain()
\ No newline at end of file
+
+        # Walk parent indices back to the root session
+        parents = self._parents
+        chain_indices = []
+        while idx != -1:
+            chain_indices.append(idx)
+            idx = parents[idx]
+
+        session_ids = self._session_ids
+        return [session_ids[i] for i in reversed(chain_indices)]
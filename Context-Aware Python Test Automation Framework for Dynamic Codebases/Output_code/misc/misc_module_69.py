@@ -3,20 +3,58 @@ class DissentCollector:
     Collects and aggregates dissent from personas
     about constraint overrides.
     """
-    def __init__(self, dissent_registry=None):
+    def __init__(self, dissent_registry=None, registry_lock=None, max_concurrent=16):
         self.dissent_registry = dissent_registry or DissentRegistry()
+        self.registry_lock = registry_lock or threading.Lock()  # Guards registry writes
+        self.max_concurrent = max_concurrent  # Max persona evaluations in flight
         
     def collect_dissent(self, mutation_id, personas, constraint_results, session_context):
         """
         Collect dissent from multiple personas about a mutation
         Returns collected dissent reports
         """
+        personas = list(personas)
+        
+        # Check whether each persona wants to dissent
+        evaluations = [
+            persona.evaluate_override(mutation_id, constraint_results)
+            for persona in personas
+        ]
+        
+        return self._register_reports(mutation_id, personas, evaluations, session_context)
+        
+    async def collect_dissent_async(self, mutation_id, personas, constraint_results, session_context):
+        """
+        Collect dissent from multiple personas about a mutation
+        Personas with a coroutine evaluate_override are evaluated concurrently;
+        synchronous ones are called directly
+        Returns collected dissent reports
+        """
+        personas = list(personas)
+        
+        # Use semaphore to limit concurrency
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+        
+        async def evaluate_with_semaphore(persona):
+            async with semaphore:
+                dissent_data = persona.evaluate_override(mutation_id, constraint_results)
+                if inspect.isawaitable(dissent_data):
+                    dissent_data = await dissent_data
+                return dissent_data
+                
+        # Check whether each persona wants to dissent
+        evaluations = await asyncio.gather(*[evaluate_with_semaphore(p) for p in personas])
+        
+        return self._register_reports(mutation_id, personas, evaluations, session_context)
+        
+    def _register_reports(self, mutation_id, personas, evaluations, session_context):
+        """
+        Build dissent reports from persona evaluations and register them
+        Returns the reports in persona order
+        """
         collected_reports = []
         
-        for persona in personas:
-            # Check if persona wants to dissent
-            dissent_data = persona.evaluate_override(mutation_id, constraint_results)
-            
+        for persona, dissent_data in zip(personas, evaluations):
             if dissent_data and dissent_data.get("dissent", False):
                 # Create dissent report
                 report = PersonaDissent(
@@ -34,13 +72,15 @@ class DissentCollector:
                         reason=objection.get("reason", "")
                     )
                     
-                # Register in the registry
+                collected_reports.append(report)
+                
+        # Register in the registry
+        with self.registry_lock:
+            for report in collected_reports:
                 self.dissent_registry.register_dissent(
                     mutation_id,
                     report,
                     session_context
                 )
                 
-                collected_reports.append(report)
-                
         return collected_reports
\ No newline at end of file
@@ -1,3 +1,9 @@
+try:
+    import orjson
+except ImportError:
+    # orjson not available
+    orjson = None
+
 class DissentReporter:
     """
     Generates reports and visualizations of persona dissent
@@ -5,7 +11,7 @@ class DissentReporter:
     """
     def __init__(self, dissent_registry=None):
         self.dissent_registry = dissent_registry or DissentRegistry()
-        
+
     def generate_dissent_report(self, mutation_id, session_context=None):
         """
         Generate a comprehensive report on dissent for a mutation
@@ -16,7 +22,7 @@ class DissentReporter:
             mutation_id,
             apply_decay=False
         )
-        
+
         # If session context provided, also get decay-adjusted reports
         decayed_reports = None
         if session_context:
@@ -25,110 +31,164 @@ class DissentReporter:
                 apply_decay=True,
                 session_context=session_context
             )
-            
+
+        # Single pass over the raw reports collects objections, weighted
+        # scores and serialized records together
+        objections = self._new_objection_tally()
+        raw_data, raw_by_id, raw_score = self._scan_reports(raw_reports, objections)
+
         # Build the report
         report = {
             "mutation_id": mutation_id,
             "timestamp": time.time(),
             "total_dissent_count": len(raw_reports),
-            "dissent_by_role": self._group_by_role(raw_reports),
-            "top_objections": self._extract_top_objections(raw_reports),
+            "dissent_by_role": self._group_by_role(mutation_id),
+            "top_objections": self._extract_top_objections(objections),
             "comprehensive_data": {
-                "raw": [r.to_dict() for r in raw_reports]
+                "raw": raw_data
             }
         }
-        
+
         # Add decay analysis if available
         if decayed_reports:
-            report["decay_analysis"] = self._analyze_decay(raw_reports, decayed_reports)
-            report["comprehensive_data"]["decayed"] = [r.to_dict() for r in decayed_reports]
-            report["effective_dissent_score"] = self._calculate_effective_score(decayed_reports)
-            
+            decayed_data, decayed_by_id, decayed_score = self._scan_reports(decayed_reports)
+            report["decay_analysis"] = self._analyze_decay(
+                raw_by_id, decayed_by_id, raw_score, decayed_score
+            )
+            report["comprehensive_data"]["decayed"] = decayed_data
+            report["effective_dissent_score"] = decayed_score
+
         return report
-        
-    def _group_by_role(self, dissent_reports):
-        """Group dissent reports by persona role"""
-        by_role = {}
-        
-        for report in dissent_reports:
-            role = report.persona_role
-            if role not in by_role:
-                by_role[role] = {
-                    "count": 0,
-                    "average_score": 0,
-                    "reports": []
-                }
-                
-            by_role[role]["count"] += 1
-            by_role[role]["reports"].append(report)
+
+    def to_json(self, report):
+        """
+        Serialize a dissent report to JSON
+        """
+        if orjson is None:
+            return json.dumps(report, default=self._json_default)
             
-        # Calculate average scores
-        for role, data in by_role.items():
-            if data["count"] > 0:
-                total = sum(r.dissent_score for r in data["reports"])
-                data["average_score"] = total / data["count"]
-                
-        return by_role
-        
-    def _extract_top_objections(self, dissent_reports):
-        """Extract the most common objections"""
-        objection_counts = {}
-        
+        return orjson.dumps(
+            report,
+            default=self._json_default,
+            option=orjson.OPT_NON_STR_KEYS
+        ).decode("utf-8")
+
+    def _json_default(self, obj):
+        """Encode dissent report objects for JSON output"""
+        if isinstance(obj, PersonaDissent):
+            return obj.to_dict()
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    def _scan_reports(self, dissent_reports, objections=None):
+        """
+        Traverse dissent reports once
+        Returns serialized reports, reports by persona and the effective score,
+        tallying objections along the way when a tally is given
+        """
+        serialized = []
+        by_id = {}
+        total_weight = 0.0
+        weighted_sum = 0.0
+
         for report in dissent_reports:
-            for objection in report.objections:
-                constraint_id = objection.get("constraint_id")
-                if constraint_id not in objection_counts:
-                    objection_counts[constraint_id] = {
-                        "count": 0,
-                        "total_severity": 0,
-                        "reasons": []
-                    }
-                    
-                objection_counts[constraint_id]["count"] += 1
-                objection_counts[constraint_id]["total_severity"] += objection.get("severity", 0.5)
-                objection_counts[constraint_id]["reasons"].append(objection.get("reason", ""))
-                
-        # Calculate average severity and sort
-        top_objections = []
-        for constraint_id, data in objection_counts.items():
-            avg_severity = data["total_severity"] / data["count"] if data["count"] > 0 else 0
-            top_objections.append({
-                "constraint_id": constraint_id,
-                "count": data["count"],
-                "average_severity": avg_severity,
-                "sample_reasons": data["reasons"][:3]  # Just include a few examples
-            })
-            
-        # Sort by count, then severity
-        return sorted(
-            top_objections, 
-            key=lambda x: (x["count"], x["average_severity"]),
-            reverse=True
+            serialized.append(report.to_dict())
+            by_id[report.persona_id] = report
+
+            weight = report.persona_weight
+            total_weight += weight
+            weighted_sum += report.dissent_score * weight
+
+            if objections is not None:
+                self._tally_objections(objections, report)
+
+        effective_score = weighted_sum / total_weight if total_weight > 0 else 0.0
+        return serialized, by_id, effective_score
+
+    def _group_by_role(self, mutation_id):
+        """Group dissent reports by persona role"""
+        # Role counts and score sums are maintained by the registry on registration
+        return self.dissent_registry.get_role_summary(mutation_id)
+
+    def _new_objection_tally(self):
+        """Create empty parallel arrays for flattened objections"""
+        return {
+            "index": {},  # Maps constraint_id to its dense index
+            "constraint_ids": [],
+            "sample_reasons": [],
+            "codes": [],
+            "severities": []
+        }
+
+    def _tally_objections(self, tally, report):
+        """Append a report's objections to the flattened objection arrays"""
+        constraint_index = tally["index"]
+        constraint_ids = tally["constraint_ids"]
+        sample_reasons = tally["sample_reasons"]
+
+        codes = tally["codes"]
+        severities = tally["severities"]
+
+        for objection in report.objections:
+            constraint_id = objection.get("constraint_id")
+            code = constraint_index.get(constraint_id)
+            if code is None:
+                code = constraint_index[constraint_id] = len(constraint_ids)
+                constraint_ids.append(constraint_id)
+                sample_reasons.append([])
+
+            codes.append(code)
+            severities.append(objection.get("severity", 0.5))
+            if len(sample_reasons[code]) < 3:  # Just include a few examples
+                sample_reasons[code].append(objection.get("reason", ""))
+
+    def _extract_top_objections(self, tally):
+        """Extract the most common objections"""
+        constraint_ids = tally["constraint_ids"]
+        if not constraint_ids:
+            return []
+
+        # Count and average severity per constraint in a single vectorized pass
+        codes = np.asarray(tally["codes"], dtype=np.intp)
+        counts = np.bincount(codes, minlength=len(constraint_ids))
+        severity_sums = np.bincount(
+            codes,
+            weights=np.asarray(tally["severities"], dtype=np.float64),
+            minlength=len(constraint_ids)
         )
-        
-    def _analyze_decay(self, raw_reports, decayed_reports):
+        average_severities = severity_sums / counts
+
+        # Sort by count, then severity (descending), keeping first-seen order for ties
+        order = np.lexsort((-np.arange(len(constraint_ids)), average_severities, counts))[::-1]
+
+        sample_reasons = tally["sample_reasons"]
+        return [
+            {
+                "constraint_id": constraint_ids[i],
+                "count": int(counts[i]),
+                "average_severity": float(average_severities[i]),
+                "sample_reasons": sample_reasons[i]
+            }
+            for i in order
+        ]
+
+    def _analyze_decay(self, raw_by_id, decayed_by_id, raw_total, decayed_total):
         """Analyze the effect of decay on dissent reports"""
-        raw_by_id = {r.persona_id: r for r in raw_reports}
-        decayed_by_id = {r.persona_id: r for r in decayed_reports}
-        
         decay_analysis = {
             "total_decay_effect": 0,
             "persona_decay": []
         }
-        
+
         # Calculate total decay effect
-        if raw_reports:
-            raw_total = self._calculate_effective_score(raw_reports)
-            decayed_total = self._calculate_effective_score(decayed_reports)
+        if raw_by_id:
             decay_analysis["total_decay_effect"] = 1 - (decayed_total / raw_total) if raw_total > 0 else 0
-            
+
         # Calculate per-persona decay
         for persona_id, raw in raw_by_id.items():
             if persona_id in decayed_by_id:
                 decayed = decayed_by_id[persona_id]
-                
+
                 decay_percent = 1 - (decayed.persona_weight / raw.persona_weight)
-                
+
                 decay_analysis["persona_decay"].append({
                     "persona_id": persona_id,
                     "role": raw.persona_role,
@@ -136,22 +196,5 @@ class DissentReporter:
                     "decayed_weight": decayed.persona_weight,
                     "decay_percent": decay_percent
                 })
-                
+
         return decay_analysis
-        
-    def _calculate_effective_score(self, dissent_reports):
-        """Calculate the effective dissent score from reports"""
-        if not dissent_reports:
-            return 0.0
-            
-        total_weight = 0.0
-        weighted_sum = 0.0
-        
-        for report in dissent_reports:
-            weight = report.persona_weight
-            total_weight += weight
-            weighted_sum += report.dissent_score * weight
-            
-        if total_weight > 0:
-            return weighted_sum / total_weight
-        return 0.0
\ No newline at end of file
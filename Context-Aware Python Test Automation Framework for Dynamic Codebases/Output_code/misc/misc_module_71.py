@@ -1,8 +1,72 @@
+# Process-wide session and dissent state shared by all override requests
+_SESSION_MGR = SessionManager()
+_DISSENT_REGISTRY = DissentRegistry()
+_OVERRIDE_STATE_LOCK = threading.Lock()  # Guards mutations of the shared state
+_SAFETY_VETO = SafetyVeto()
+
+
 def process_override_request(standard_mutation, override_reason, initiating_persona,
                            personas, context):
     """
     Process a request to override constraints on a mutation
     """
+    request = _start_override_request(standard_mutation, override_reason,
+                                      initiating_persona, personas, context)
+    if "result" in request:
+        return request["result"]
+        
+    # Step 3: Collect dissent from other personas
+    dissent_reports = []
+    if request["dissent_collector"] is not None:
+        dissent_reports = request["dissent_collector"].collect_dissent(
+            mutation_id=standard_mutation.id,
+            personas=request["personas"],
+            constraint_results={},  # Would be populated with actual constraint results
+            session_context=request["session_context"]
+        )
+    
+    return _finish_override_request(standard_mutation, request, dissent_reports, context)
+
+
+async def process_override_request_async(standard_mutation, override_reason, initiating_persona,
+                                         personas, context):
+    """
+    Process a request to override constraints on a mutation,
+    evaluating coroutine personas concurrently
+    """
+    request = _start_override_request(standard_mutation, override_reason,
+                                      initiating_persona, personas, context)
+    if "result" in request:
+        return request["result"]
+        
+    # Step 3: Collect dissent from other personas
+    dissent_reports = []
+    if request["dissent_collector"] is not None:
+        dissent_reports = await request["dissent_collector"].collect_dissent_async(
+            mutation_id=standard_mutation.id,
+            personas=request["personas"],
+            constraint_results={},  # Would be populated with actual constraint results
+            session_context=request["session_context"]
+        )
+    
+    return _finish_override_request(standard_mutation, request, dissent_reports, context)
+
+
+def _start_override_request(standard_mutation, override_reason, initiating_persona,
+                            personas, context):
+    """
+    Steps shared by both entry points before dissent is collected
+    Returns {"result": ...} when the request is settled early
+    """
+    # Fast path: a safety violation rejects the override outright, before
+    # any session, dissent or evaluation work is done
+    if context and _SAFETY_VETO.applies(None, context):
+        return {"result": {
+            "evaluation": _SAFETY_VETO.apply(None, context),
+            "dissent_report": None,
+            "override_allowed": False
+        }}
+        
     # Step 1: Create the override mutation
     override_mutation = ConstraintOverrideMutation(
         standard_mutation=standard_mutation,
@@ -11,17 +75,31 @@ def process_override_request(standard_mutation, override_reason, initiating_pers
     )
     
     # Step 2: Get session context
-    session_mgr = SessionManager()
-    session_context = session_mgr.get_session_context(context)
+    with _OVERRIDE_STATE_LOCK:
+        session_context = _SESSION_MGR.get_session_context(context)
     
-    # Step 3: Collect dissent from other personas
-    dissent_collector = DissentCollector()
-    dissent_reports = dissent_collector.collect_dissent(
-        mutation_id=standard_mutation.id,
-        personas=personas,
-        constraint_results={},  # Would be populated with actual constraint results
-        session_context=session_context
-    )
+    personas = list(personas)
+    dissent_collector = None
+    # With only the initiating persona present there is nobody to dissent
+    if not all(persona.id == initiating_persona.id for persona in personas):
+        dissent_collector = DissentCollector(
+            dissent_registry=_DISSENT_REGISTRY,
+            registry_lock=_OVERRIDE_STATE_LOCK
+        )
+    
+    return {
+        "override_mutation": override_mutation,
+        "session_context": session_context,
+        "personas": personas,
+        "dissent_collector": dissent_collector
+    }
+
+
+def _finish_override_request(standard_mutation, request, dissent_reports, context):
+    """
+    Steps shared by both entry points after dissent is collected
+    """
+    override_mutation = request["override_mutation"]
     
     # Step 4: Add dissent to the mutation
     for report in dissent_reports:
@@ -32,10 +110,10 @@ def process_override_request(standard_mutation, override_reason, initiating_pers
     evaluation_result = engine.evaluate_mutation(override_mutation, context)
     
     # Step 6: Generate dissent report
-    reporter = DissentReporter()
+    reporter = DissentReporter(dissent_registry=_DISSENT_REGISTRY)
     dissent_report = reporter.generate_dissent_report(
         standard_mutation.id,
-        session_context
+        request["session_context"]
     )
     
     # Step 7: Return result with all metadata
@@ -3,18 +3,16 @@ def cross_session_override(original_session_id, mutation_id,
     """
     Process an override request that spans multiple sessions
     """
-    # Step 1: Get the original session context
-    session_mgr = SessionManager()
-    
-    # Step 2: Create a new session hopping from the original
-    new_session_id, new_context = session_mgr.hop_to_new_session(
-        original_session_id,
-        metadata={"override_request": True}
-    )
+    # Steps 1-2: Create a new session hopping from the original context
+    # held by the shared session manager
+    with _OVERRIDE_STATE_LOCK:
+        new_session_id, new_context = _SESSION_MGR.hop_to_new_session(
+            original_session_id,
+            metadata={"override_request": True}
+        )
     
     # Step 3: Get existing dissent with decay applied
-    dissent_registry = DissentRegistry()
-    decayed_dissent = dissent_registry.get_dissent_reports(
+    decayed_dissent = _DISSENT_REGISTRY.get_dissent_reports(
         mutation_id,
         apply_decay=True,
         session_context=new_context
@@ -7,7 +7,7 @@ async def deduplicate_mutations(mutations):
         # Create a simplified representation for comparison
         # This could be a hash of the key content or a more sophisticated similarity measure
         simplified = f"{mutation.original_prompt[:100]}_{mutation.mutated_prompt[:100]}"
-        hash_key = hashlib.md5(simplified.encode()).hexdigest()
+        hash_key = hashlib.sha1(simplified.encode(), usedforsecurity=False).digest()
         
         if hash_key not in similarity_groups:
             similarity_groups[hash_key] = []
@@ -1,11 +1,65 @@
+class _VersionedContexts(dict):
+    """LLM context dict that counts its modifications, so indexes over it can tell when they are stale"""
+    version = 0
+    
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.version += 1
+        
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.version += 1
+        
+    def __ior__(self, other):
+        self.update(other)
+        return self
+        
+    def pop(self, *args):
+        self.version += 1
+        return super().pop(*args)
+        
+    def popitem(self):
+        self.version += 1
+        return super().popitem()
+        
+    def setdefault(self, key, default=None):
+        self.version += 1
+        return super().setdefault(key, default)
+        
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self.version += 1
+        
+    def clear(self):
+        super().clear()
+        self.version += 1
+
 class SimulationSnapshotPack:
     def __init__(self, snapshot_id, creation_timestamp):
         self.snapshot_id = snapshot_id
         self.creation_timestamp = creation_timestamp
-        self.llm_contexts = {}  # Keyed by persona+format combo
+        self.llm_contexts = _VersionedContexts()  # Keyed by persona+format combo
         self.constraint_cache = {}  # Pre-compiled constraint evaluators
         self.tool_manifests = {}  # Shared tool definitions
         self.persona_fingerprints = {}  # Behavioral fingerprints
+        self._contexts_by_format = None  # format -> persona -> llm_contexts key
+        self._indexed_version = -1  # llm_contexts.version the index reflects
+        
+    def add_llm_context(self, format_type, persona_type, context):
+        """Register an LLM context for a format/persona combination"""
+        key = (format_type, persona_type)
+        index_current = (self._contexts_by_format is not None
+                         and self._indexed_version == self._contexts_version())
+        self.llm_contexts[key] = context
+        
+        # Extend an up-to-date index in place rather than rebuilding it
+        if index_current:
+            self._contexts_by_format.setdefault(format_type, {})[persona_type] = key
+            self._indexed_version = self._contexts_version()
+            
+    def _contexts_version(self):
+        """Modification count of llm_contexts, or None if it was replaced by a plain dict"""
+        return getattr(self.llm_contexts, 'version', None)
         
     def warm_start_simulation(self, format_types: List[PromptFormat], 
                              persona_types: List[PersonaType],
@@ -25,8 +79,27 @@ class SimulationSnapshotPack:
         
     def _filter_relevant_contexts(self, formats, personas):
         """Select only needed LLM contexts based on format and persona combinations"""
-        keys = [(f, p) for f in formats for p in personas]
-        return {k: self.llm_contexts[k] for k in keys if k in self.llm_contexts}
+        # llm_contexts may also be written directly, so the index is rebuilt
+        # whenever the dict has changed since it was built
+        # (every call, if llm_contexts was replaced by a plain dict)
+        version = self._contexts_version()
+        if self._contexts_by_format is None or version is None or self._indexed_version != version:
+            self._contexts_by_format = {}
+            for key in self.llm_contexts:
+                self._contexts_by_format.setdefault(key[0], {})[key[1]] = key
+            self._indexed_version = version
+        
+        # Only probe personas under formats that have any contexts at all
+        result = {}
+        for f in formats:
+            by_persona = self._contexts_by_format.get(f)
+            if not by_persona:
+                continue
+            for p in personas:
+                key = by_persona.get(p)
+                if key is not None:
+                    result[key] = self.llm_contexts[key]
+        return result
 
 class SnapshotManager:
     """Manages creation and retrieval of simulation snapshots"""
@@ -35,40 +108,94 @@ class SnapshotManager:
         self.snapshot_dir = snapshot_dir
         self.max_snapshots = max_snapshots
         self.ttl_hours = ttl_hours
-        self.snapshot_index = self._load_snapshot_index()
+        # Bit position assigned to each format, persona and capability tag
+        self.tag_bits = {'formats': {}, 'personas': {}, 'capabilities': {}}
+        self.snapshot_index = self._prepare_snapshot_index(self._load_snapshot_index())
+        
+    def _prepare_snapshot_index(self, snapshot_index):
+        """
+        Freeze snapshot tag lists into sets once, so lookups don't rebuild them,
+        and encode each tag set as an integer bitmask
+        """
+        for metadata in snapshot_index.values():
+            for kind, bits in self.tag_bits.items():
+                tags = frozenset(metadata[kind])
+                metadata[kind] = tags
+                
+                mask = 0
+                for tag in tags:
+                    bit = bits.get(tag)
+                    if bit is None:
+                        bit = bits[tag] = 1 << len(bits)
+                    mask |= bit
+                metadata[kind + '_mask'] = mask
+        return snapshot_index
+        
+    def _query_mask(self, kind, tags):
+        """
+        Encode requested tags as a bitmask; tags no snapshot has map to no bit
+        Returns the mask and the number of distinct requested tags
+        """
+        bits = self.tag_bits[kind]
+        mask = 0
+        unknown = None  # Only tags outside the index need a set to be counted
+        for tag in tags:
+            bit = bits.get(tag)
+            if bit is None:
+                if unknown is None:
+                    unknown = set()
+                unknown.add(tag)
+            else:
+                mask |= bit
+        return mask, mask.bit_count() + (len(unknown) if unknown else 0)
         
     def get_snapshot(self, req_formats, req_personas, req_capabilities):
         """Retrieve the most applicable snapshot for the given requirements"""
         # Find best matching snapshot using similarity scoring
         best_match = self._find_best_match(req_formats, req_personas, req_capabilities)
-        if best_match and self._is_fresh(best_match):
+        if best_match:
             return self._load_snapshot(best_match)
         
         # No suitable snapshot found, create new one
         return self._create_new_snapshot(req_formats, req_personas, req_capabilities)
     
     def _find_best_match(self, formats, personas, capabilities):
-        """Find the best matching snapshot using a similarity score"""
+        """Find the best fresh snapshot whose similarity score reaches 0.8"""
         if not self.snapshot_index:
             return None
             
-        scores = []
+        # Encode the query once for all snapshots; coverage then reduces to
+        # popcounts of mask intersections
+        format_mask, format_count = self._query_mask('formats', formats)
+        persona_mask, persona_count = self._query_mask('personas', personas)
+        capability_mask, capability_count = self._query_mask('capabilities', capabilities)
+        
+        best_id, best_score = None, 0.8  # Minimum acceptable score
         for snapshot_id, metadata in self.snapshot_index.items():
-            # Calculate format, persona and capability coverage
-            format_coverage = len(set(formats) & set(metadata['formats'])) / len(formats)
-            persona_coverage = len(set(personas) & set(metadata['personas'])) / len(personas)
-            capability_coverage = len(set(capabilities) & set(metadata['capabilities'])) / len(capabilities)
+            # Weight the scores - prioritize persona matches (0.5), then
+            # formats (0.3) and capabilities (0.2), skipping the snapshot as
+            # soon as the remaining weight can no longer reach the best score
+            persona_coverage = (persona_mask & metadata['personas_mask']).bit_count() / persona_count
+            weighted_score = persona_coverage * 0.5
+            if weighted_score + 0.5 < best_score:
+                continue
+                
+            format_coverage = (format_mask & metadata['formats_mask']).bit_count() / format_count
+            weighted_score += format_coverage * 0.3
+            if weighted_score + 0.2 < best_score:
+                continue
+                
+            capability_coverage = (capability_mask & metadata['capabilities_mask']).bit_count() / capability_count
+            weighted_score += capability_coverage * 0.2
             
-            # Weight the scores - prioritize persona matches
-            weighted_score = (format_coverage * 0.3 + 
-                             persona_coverage * 0.5 + 
-                             capability_coverage * 0.2)
-            
-            scores.append((snapshot_id, weighted_score))
-        
-        # Return highest scoring snapshot above threshold
-        scores.sort(key=lambda x: x[1], reverse=True)
-        return scores[0][0] if scores and scores[0][1] >= 0.8 else None
+            # Keep the first snapshot reaching the highest score; freshness is
+            # only checked for a snapshot that would replace the current best,
+            # and a stale one leaves the scan to carry on with the next
+            if weighted_score > best_score or (best_id is None and weighted_score >= best_score):
+                if self._is_fresh(snapshot_id):
+                    best_id, best_score = snapshot_id, weighted_score
+                
+        return best_id
 
 class SimulationCoordinator:
     """Coordinates CI simulation runs with optimized startup"""
@@ -1,3 +1,28 @@
+# Bound once at module level so scoring calls skip the attribute lookup
+_sha256 = hashlib.sha256
+
+@functools.lru_cache(maxsize=8192)
+def _ngrams(text: str, q: int = 5) -> frozenset:
+    """Character q-grams of a prompt text (the whole text if shorter than q)"""
+    if len(text) < q:
+        return frozenset((text,)) if text else frozenset()
+    return frozenset(text[i:i + q] for i in range(len(text) - q + 1))
+
+@functools.lru_cache(maxsize=8192)
+def _text_similarity(a: str, b: str) -> float:
+    """Memoized 5-gram Jaccard similarity between two prompt texts"""
+    if a == b:
+        return 1.0
+    a_grams = _ngrams(a)
+    b_grams = _ngrams(b)
+    shared = len(a_grams & b_grams)
+    union = len(a_grams) + len(b_grams) - shared
+    return shared / union if union else 1.0
+
+# Jaccard over 5-grams scores lower than SequenceMatcher's ratio for the same
+# edit, so the cluster match threshold is relaxed accordingly
+_CLUSTER_MATCH_THRESHOLD = 0.75
+
 class ArbitrationMetrics:
     """Metrics for evaluating arbitration decisions against persona divergence"""
     
@@ -10,42 +35,42 @@ class ArbitrationMetrics:
         """Calculate metrics for arbitration quality"""
         decisions = divergence_analysis.decisions
         
-        # If no weights provided, use equal weights
+        # If no weights provided, use the analysis' precomputed equal weights
         if persona_weights is None:
-            persona_weights = {d.persona_id: 1.0 for d in decisions}
-            
-        # Normalize weights
-        weight_sum = sum(persona_weights.values())
-        normalized_weights = {
-            pid: w / weight_sum for pid, w in persona_weights.items()
-        }
+            normalized_weights = divergence_analysis.equal_normalized_weights
+        else:
+            # Normalize weights
+            weight_sum = sum(persona_weights.values())
+            normalized_weights = {
+                pid: w / weight_sum for pid, w in persona_weights.items()
+            }
         
         # Find which decision corresponds to the arbitration result
-        arbitration_hash = hashlib.sha256(arbitration_result.mutated.encode()).hexdigest()
+        arbitration_hash = _sha256(arbitration_result.mutated.encode()).hexdigest()
+        
+        # Weights and similarities are kept as arrays aligned with decision order
+        weights_arr = np.fromiter(
+            (normalized_weights.get(d.persona_id, 0.0) for d in decisions),
+            dtype=np.float64,
+            count=len(decisions)
+        )
+        sims_arr = np.empty_like(weights_arr)
         
         # Map each persona's decision to a similarity score with the arbitration result
         arbitration_similarities = {}
-        for decision in decisions:
-            # Simple text similarity - could use more sophisticated metrics
-            decision_hash = hashlib.sha256(decision.mutated_prompt.encode()).hexdigest()
-            
+        for i, decision in enumerate(decisions):
             # Perfect match gets 1.0 similarity
-            if decision_hash == arbitration_hash:
-                arbitration_similarities[decision.persona_id] = 1.0
+            if decision.mutated_hash == arbitration_hash:
+                similarity = 1.0
             else:
                 # Calculate similarity based on text overlap
                 # This is a simplified approach - real implementation would use better similarity metrics
-                from difflib import SequenceMatcher
-                similarity = SequenceMatcher(
-                    None, decision.mutated_prompt, arbitration_result.mutated
-                ).ratio()
-                arbitration_similarities[decision.persona_id] = similarity
+                similarity = _text_similarity(decision.mutated_prompt, arbitration_result.mutated)
+            arbitration_similarities[decision.persona_id] = similarity
+            sims_arr[i] = similarity
         
         # Calculate weighted average similarity (higher is better)
-        weighted_similarity = sum(
-            normalized_weights.get(pid, 0) * sim 
-            for pid, sim in arbitration_similarities.items()
-        )
+        weighted_similarity = float(weights_arr @ sims_arr)
         
         # Calculate metrics
         metrics = {
@@ -55,20 +80,13 @@ class ArbitrationMetrics:
             "decision_support": 0.0      # Will calculate below
         }
         
-        # Find which cluster the arbitration belongs to
+        # Find which cluster the arbitration belongs to via the persona whose
+        # result best matches it (exact matches already score 1.0)
         arbitration_cluster = -1
-        for i, cluster in enumerate(divergence_analysis.decision_clusters):
-            # Check if any persona in this cluster produced a result that matches arbitration
-            cluster_hashes = [
-                hashlib.sha256(d.mutated_prompt.encode()).hexdigest()
-                for d in decisions if d.persona_id in cluster
-            ]
-            if arbitration_hash in cluster_hashes or any(
-                SequenceMatcher(None, arbitration_result.mutated, d.mutated_prompt).ratio() > 0.9
-                for d in decisions if d.persona_id in cluster
-            ):
-                arbitration_cluster = i
-                break
+        if arbitration_similarities:
+            best_pid = max(arbitration_similarities, key=arbitration_similarities.get)
+            if arbitration_similarities[best_pid] > _CLUSTER_MATCH_THRESHOLD:
+                arbitration_cluster = divergence_analysis.persona_cluster_index.get(best_pid, -1)
                 
         # Calculate decision support metrics
         if arbitration_cluster >= 0:
@@ -84,7 +102,7 @@ class ArbitrationMetrics:
             # Entropy calculation based on cluster selection
             # Lower entropy means the arbitration was more predictable
             probability = cluster_weight
-            metrics["arbitration_entropy"] = -probability * np.log2(probability) if probability > 0 else 0
+            metrics["arbitration_entropy"] = (-probability * math.log2(probability)) if probability > 0.0 else 0.0
             
         else:
             # The arbitration doesn't match any known cluster - it's a novel solution
@@ -96,6 +114,15 @@ class ArbitrationMetrics:
             
         return metrics
 
+# Arbitration categories by support ratio quarter: (0, 0.25], (0.25, 0.5],
+# (0.5, 0.75] and (0.75, 1]
+_CATEGORIES = (
+    "Minority Selection",
+    "Plurality Selection",
+    "Majority Selection",
+    "Consensus Selection"
+)
+
 class DivergenceAwareArbitrationScorer:
     """Enhanced arbitration scorer that accounts for persona divergence"""
     
@@ -104,7 +131,7 @@ class DivergenceAwareArbitrationScorer:
                 persona_replay_simulator: PersonaReplaySimulator):
         self.divergence_service = divergence_service
         self.simulator = persona_replay_simulator
-        self.arbitration_metrics: Dict[str, Dict[str, Any]] = {}
+        self.arbitration_metrics = BoundedTTLCache(max_size=10000, ttl_seconds=3600)
     
     async def score_arbitration_with_divergence(self,
                                              mutation_id: str,
@@ -159,15 +186,11 @@ class DivergenceAwareArbitrationScorer:
                 (1 - support_weight) * metrics["weighted_similarity"]
             )
             
-            # Categorize the arbitration
-            if metrics["support_ratio"] > 0.75:
-                metrics["arbitration_category"] = "Consensus Selection"
-            elif metrics["support_ratio"] > 0.5:
-                metrics["arbitration_category"] = "Majority Selection"
-            elif metrics["support_ratio"] > 0.25:
-                metrics["arbitration_category"] = "Plurality Selection"
-            else:
-                metrics["arbitration_category"] = "Minority Selection"
+            # Categorize the arbitration by indexing its support quarter; the
+            # ceiling keeps each quarter's upper bound inclusive
+            category_idx = math.ceil(metrics["support_ratio"] * 4.0) - 1
+            category_idx = 3 if category_idx > 3 else (0 if category_idx < 0 else category_idx)
+            metrics["arbitration_category"] = _CATEGORIES[category_idx]
         
         return metrics
 
@@ -186,24 +209,42 @@ class DivergenceAwareArbitrationScorer:
             "mutation_results": {}
         }
         
-        scores = []
-        entropy_values = []
+        category_counts = Counter()
+        
+        # Streaming (Welford) moments of scores and divergence entropy
+        score_count = 0
+        score_mean = entropy_mean = 0.0
+        score_m2 = entropy_m2 = co_moment = 0.0
+        
+        # Score all available arbitrations concurrently
+        scored_ids = [mid for mid in mutation_ids if mid in arbitration_results]
+        scored_results = await asyncio.gather(
+            *(
+                self.score_arbitration_with_divergence(
+                    mutation_id=mid,
+                    arbitration_result=arbitration_results[mid],
+                    persona_weights=persona_weights
+                )
+                for mid in scored_ids
+            ),
+            return_exceptions=True
+        )
+        results_by_id = dict(zip(scored_ids, scored_results))
         
         for mutation_id in mutation_ids:
-            if mutation_id not in arbitration_results:
+            if mutation_id not in results_by_id:
                 strategy_metrics["mutation_results"][mutation_id] = {
                     "error": "No arbitration result available"
                 }
                 continue
                 
-            arbitration_result = arbitration_results[mutation_id]
+            metrics = results_by_id[mutation_id]
             
-            # Score this arbitration
-            metrics = await self.score_arbitration_with_divergence(
-                mutation_id=mutation_id,
-                arbitration_result=arbitration_result,
-                persona_weights=persona_weights
-            )
+            if isinstance(metrics, Exception):
+                strategy_metrics["mutation_results"][mutation_id] = {
+                    "error": f"Scoring failed: {metrics}"
+                }
+                continue
             
             if "error" in metrics:
                 strategy_metrics["mutation_results"][mutation_id] = metrics
@@ -213,27 +254,35 @@ class DivergenceAwareArbitrationScorer:
             strategy_metrics["mutation_results"][mutation_id] = metrics
             
             # Update aggregates
-            scores.append(metrics["arbitration_score"])
-            entropy_values.append(metrics["divergence_entropy"])
+            score = metrics["arbitration_score"]
+            entropy = metrics["divergence_entropy"]
+            score_count += 1
+            score_delta = score - score_mean
+            score_mean += score_delta / score_count
+            entropy_delta = entropy - entropy_mean
+            entropy_mean += entropy_delta / score_count
+            score_m2 += score_delta * (score - score_mean)
+            entropy_m2 += entropy_delta * (entropy - entropy_mean)
+            co_moment += score_delta * (entropy - entropy_mean)
             
             # Update category counts
-            category = metrics["arbitration_category"]
-            strategy_metrics["category_distribution"][category] = (
-                strategy_metrics["category_distribution"].get(category, 0) + 1
-            )
+            category_counts[metrics["arbitration_category"]] += 1
         
         # Calculate overall metrics
-        if scores:
-            strategy_metrics["average_score"] = np.mean(scores)
-            strategy_metrics["score_std_dev"] = np.std(scores)
+        if score_count:
+            strategy_metrics["average_score"] = score_mean
+            strategy_metrics["score_std_dev"] = (score_m2 / score_count) ** 0.5
             
             # Convert category counts to percentages
-            for category, count in strategy_metrics["category_distribution"].items():
-                strategy_metrics["category_distribution"][category] = count / len(scores)
+            strategy_metrics["category_distribution"] = {
+                category: count / score_count for category, count in category_counts.items()
+            }
             
             # Calculate correlation between divergence and arbitration score
-            if len(scores) > 1 and len(entropy_values) == len(scores):
-                correlation = np.corrcoef(entropy_values, scores)[0, 1]
+            if score_count > 1:
+                # Undefined (NaN) when either series is constant, as with np.corrcoef
+                spread = (score_m2 * entropy_m2) ** 0.5
+                correlation = co_moment / spread if spread > 0 else float("nan")
                 strategy_metrics["divergence_correlation"] = correlation
         
         return strategy_metrics
@@ -272,6 +321,30 @@ class EnhancedMutationReplayEngine(MutationReplayEngine):
         if not trace:
             raise ValueError(f"Trace {trace_id} not found")
         
+        # Execute the replay with the persona-adjusted context
+        return await self._execute_replay_with_context(trace, self._apply_persona(persona, context))
+    
+    async def replay_trace_with_personas_batch(self, 
+                                           trace_id: str, 
+                                           persona_contexts: List[Tuple[Persona, ExecutionContext]]
+                                           ) -> List[Union[SimulationResult, BaseException]]:
+        """Replay a trace once per (persona, context) pair in a single call
+        
+        The trace is looked up once for the whole batch. Results come back in
+        input order, with a failed replay's exception in its place.
+        """
+        trace = self.trace_repository.get(trace_id)
+        if not trace:
+            raise ValueError(f"Trace {trace_id} not found")
+        
+        return await asyncio.gather(
+            *(self._execute_replay_with_context(trace, self._apply_persona(persona, context))
+              for persona, context in persona_contexts),
+            return_exceptions=True
+        )
+    
+    def _apply_persona(self, persona: Persona, context: ExecutionContext) -> ExecutionContext:
+        """Adjust a replay context for a persona's characteristics"""
         # Apply the persona's style to the mutation
         # This would modify how the mutation is evaluated based on persona characteristics
         # For example, an EXPERT persona might apply stricter validation than a CREATIVE persona
@@ -288,9 +361,7 @@ class EnhancedMutationReplayEngine(MutationReplayEngine):
         # Modify context based on persona
         context.parameters["constraint_strictness"] = constraint_strictness
         context.parameters["expertise_areas"] = persona.expertise
-        
-        # Execute the replay with the modified context
-        return await self._execute_replay_with_context(trace, context)
+        return context
     
     async def _execute_replay_with_context(self, 
                                       trace: MutationTrace, 
@@ -322,61 +393,59 @@ class EnhancedMutationReplayEngine(MutationReplayEngine):
         # Execute the mutation with modified parameters
         # This is highly simplified - the real implementation would 
         # be more sophisticated about how it applies persona characteristics
-        import random
-        original_state = random.getstate()
-        random.seed(context.random_seed)
+        # Seed a replay-local generator rather than swapping the global random state,
+        # and take every draw the replay needs in one call: success, grammar,
+        # three constraints and latency
+        rng = np.random.default_rng(context.random_seed)
+        draws = rng.random(6)
+        
+        # Simulate persona-specific mutation
+        # In a real implementation, persona would influence the actual mutation algorithm
+        
+        # For simulation, we'll just slightly modify the mutated prompt
+        # based on persona parameters to demonstrate the concept
+        persona = context.parameters.get("persona", {})
+        persona_type = persona.get("type", "GENERALIST")
+        expertise = persona.get("expertise", [])
+        mutation_style = persona.get("mutation_style", "balanced")
+        
+        # Apply a simulated "persona lens" to the prompt
+        mutated_prompt = trace.mutated_prompt
+        
+        # Simulate slight variations in output based on persona
+        if persona_type == "EXPERT" and any(area.lower() in trace.mutated_prompt.lower() for area in expertise):
+            # Experts add more technical precision in their domain
+            mutated_prompt += f"\n\nNote: This approach follows best practices for {', '.join(expertise[:2])}."
+        elif persona_type == "CREATIVE":
+            # Creative personas might add flourishes
+            mutated_prompt += "\n\nThis creative approach offers several novel advantages."
+        
+        # Create a simulated result
+        success = bool(draws[0] < 0.8)  # 80% success rate
+        
+        # Simplified validation results
+        constraint_threshold = 0.9 * strictness
+        validation_results = {
+            "grammar_valid": bool(draws[1] < 0.95),
+            "model_compatible": True,
+            "constraint_details": {
+                f"constraint_{i}": bool(draws[2 + i] < constraint_threshold)
+                for i in range(3)
+            }
+        }
         
-        try:
-            # Simulate persona-specific mutation
-            # In a real implementation, persona would influence the actual mutation algorithm
-            
-            # For simulation, we'll just slightly modify the mutated prompt
-            # based on persona parameters to demonstrate the concept
-            persona = context.parameters.get("persona", {})
-            persona_type = persona.get("type", "GENERALIST")
-            expertise = persona.get("expertise", [])
-            mutation_style = persona.get("mutation_style", "balanced")
-            
-            # Apply a simulated "persona lens" to the prompt
-            mutated_prompt = trace.mutated_prompt
-            
-            # Simulate slight variations in output based on persona
-            if persona_type == "EXPERT" and any(area.lower() in trace.mutated_prompt.lower() for area in expertise):
-                # Experts add more technical precision in their domain
-                mutated_prompt += f"\n\nNote: This approach follows best practices for {', '.join(expertise[:2])}."
-            elif persona_type == "CREATIVE":
-                # Creative personas might add flourishes
-                mutated_prompt += "\n\nThis creative approach offers several novel advantages."
-            
-            # Create a simulated result
-            success = random.random() < 0.8  # 80% success rate
-            
-            # Simplified validation results
-            validation_results = {
-                "grammar_valid": random.random() < 0.95,
-                "model_compatible": True,
-                "constraint_details": {
-                    f"constraint_{i}": random.random() < (0.9 * strictness)
-                    for i in range(3)
-                }
+        result = SimulationResult(
+            mutation_id=trace.mutation_id,
+            success=success,
+            replay_output=mutated_prompt,
+            validation_results=validation_results,
+            execution_metrics={"latency": 0.5 + 1.5 * float(draws[5])},
+            llm_response={
+                "explanation": f"Applied {persona_type.lower()} perspective with focus on {mutation_style}.",
             }
-            
-            result = SimulationResult(
-                mutation_id=trace.mutation_id,
-                success=success,
-                replay_output=mutated_prompt,
-                validation_results=validation_results,
-                execution_metrics={"latency": random.uniform(0.5, 2.0)},
-                llm_response={
-                    "explanation": f"Applied {persona_type.lower()} perspective with focus on {mutation_style}.",
-                }
-            )
-            
-            return result
-            
-        finally:
-            # Restore random state
-            random.setstate(original_state)
+        )
+        
+        return result
     
     async def compare_arbitration_strategies(self,
                                         mutation_ids: List[str],
@@ -397,6 +466,9 @@ class EnhancedMutationReplayEngine(MutationReplayEngine):
         strategy_results = {}
         arbitration_by_strategy = {}
         
+        # Content-addressed pool so identical prompts share one string object
+        prompt_pool: Dict[str, str] = {}
+        
         for mutation_id in mutation_ids:
             if "error" in simulation_results.get(mutation_id, {}):
                 continue
@@ -409,8 +481,8 @@ class EnhancedMutationReplayEngine(MutationReplayEngine):
             mutations = []
             for decision in decision_dicts:
                 mutation = PromptMutation(
-                    original=decision["original_prompt"],
-                    mutated=decision["mutated_prompt"],
+                    original=prompt_pool.setdefault(decision["original_prompt"], decision["original_prompt"]),
+                    mutated=prompt_pool.setdefault(decision["mutated_prompt"], decision["mutated_prompt"]),
                     format=PromptFormat.RAW_TEXT,  # Simplified - would use actual format
                     mutation_rationale=decision["explanation"]
                 )
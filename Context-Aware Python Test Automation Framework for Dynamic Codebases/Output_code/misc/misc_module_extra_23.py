@@ -1,3 +1,9 @@
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:
+    # rapidfuzz not available
+    fuzz = process = None
+
 async def analyze_prompt_mutation_divergence(mutation_id: str):
     """Example of analyzing persona divergence for a single mutation"""
     # Configure personas
@@ -104,13 +110,35 @@ async def analyze_prompt_mutation_divergence(mutation_id: str):
     # Compare different arbitration strategies
     print("Comparing arbitration strategies...")
     
+    def majority_vote(mutations):
+        """Pick the most frequently produced mutation"""
+        # One counting pass; max() keeps the first of equally common mutations
+        counts = Counter(m.mutated for m in mutations)
+        return max(mutations, key=lambda m: counts[m.mutated])
+    
+    def consensus_seeking(mutations):
+        """
+        Pick the mutation with the highest average similarity to all others
+        With rapidfuzz, similarity is its Indel-distance ratio; without it,
+        SequenceMatcher's Ratcliff/Obershelp ratio. The two scores differ,
+        so the paths can pick different winners for the same mutations.
+        """
+        texts = [m.mutated for m in mutations]
+        if process is None:
+            similarities = np.array([
+                [SequenceMatcher(None, a, b).ratio() for b in texts]
+                for a in texts
+            ])
+        else:
+            # All pairwise ratios in one C-level call
+            similarities = process.cdist(texts, texts, scorer=fuzz.ratio) / 100.0
+        
+        # First mutation with the highest mean similarity, as sorted() picked
+        return mutations[int(np.argmax(similarities.mean(axis=1)))]
+    
     # Define some example strategies
     strategies = {
-        "Majority Vote": lambda mutations: sorted(
-            mutations, 
-            key=lambda m: sum(1 for other in mutations if other.mutated == m.mutated),
-            reverse=True
-        )[0],
+        "Majority Vote": majority_vote,
         
         "Expert Priority": lambda mutations: sorted(
             mutations,
@@ -120,15 +148,7 @@ async def analyze_prompt_mutation_divergence(mutation_id: str):
             reverse=True
         )[0],
         
-        "Consensus Seeking": lambda mutations: sorted(
-            mutations,
-            # Find mutation with highest average similarity to all others
-            key=lambda m1: sum(
-                SequenceMatcher(None, m1.mutated, m2.mutated).ratio()
-                for m2 in mutations
-            ) / len(mutations),
-            reverse=True
-        )[0]
+        "Consensus Seeking": consensus_seeking
     }
     
     strategy_comparison = await replay_engine.compare_arbitration_strategies(
@@ -1,27 +1,34 @@
-def calculate_entropy_metric(self) -> DivergenceMetric:
-    """Calculate entropy-based divergence metric"""
-    # Group decisions by their core decision hash
-    decision_hashes = [d.generate_decision_hash() for d in self.decisions]
-    counts = Counter(decision_hashes)
+def calculate_entropy_metric(self, decision_hashes: Optional[List[bytes]] = None) -> DivergenceMetric:
+    """Calculate entropy-based divergence metric
+    
+    decision_hashes may be passed in when already computed for the other
+    metrics; otherwise they are computed here.
+    """
+    # Group decisions by their core decision hash; the leading 64 bits of
+    # each digest serve as an integer label, so grouping sorts integers
+    if decision_hashes is None:
+        decision_hashes = [d.generate_decision_hash() for d in self.decisions]
+    hash_ids = np.fromiter(
+        (int.from_bytes(h[:8], "big") for h in decision_hashes), dtype=np.uint64, count=len(decision_hashes)
+    )
+    _, hash_positions, counts = np.unique(hash_ids, return_inverse=True, return_counts=True)
     
     # Calculate probabilities
-    total = len(decision_hashes)
-    probabilities = [count/total for count in counts.values()]
+    probabilities = counts / counts.sum()
     
-    # Calculate entropy using scipy
-    entropy = scipy.stats.entropy(probabilities, base=2)
+    # Calculate entropy (in bits)
+    information_per_decision = -np.log2(probabilities)
+    entropy = float((probabilities * information_per_decision).sum())
     
     # Normalize by max possible entropy
     max_entropy = np.log2(min(len(self.decisions), len(counts)))
     normalized_entropy = entropy / max_entropy if max_entropy > 0 else 0
     
     # Track individual contribution to entropy
-    persona_contributions = {}
-    for i, decision in enumerate(self.decisions):
-        hash_key = decision_hashes[i]
-        probability = counts[hash_key] / total
-        information_content = -np.log2(probability)
-        persona_contributions[decision.persona_id] = information_content
+    persona_contributions = dict(zip(
+        (d.persona_id for d in self.decisions),
+        information_per_decision[hash_positions].tolist()
+    ))
     
     return DivergenceMetric(
         type=DivergenceMetricType.ENTROPY,
@@ -3,10 +3,15 @@ def calculate_vector_distance_metric(self) -> DivergenceMetric:
     # Filter decisions with vectors
     decisions_with_vectors = [d for d in self.decisions if d.rationale_vector is not None]
     
-    # Calculate pairwise distances using cosine similarity
-    vectors = np.array([d.rationale_vector for d in decisions_with_vectors])
-    similarities = cosine_similarity(vectors)
+    # Calculate pairwise distances using cosine similarity: normalize the rows
+    # once into a contiguous buffer so the product goes straight to BLAS
+    vectors = np.array([d.rationale_vector for d in decisions_with_vectors], dtype=np.float64)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    unit_vectors = np.ascontiguousarray(vectors / np.where(norms == 0, 1.0, norms))
+    similarities = np.dot(unit_vectors, unit_vectors.T)
     distances = 1 - similarities
+    # A decision is at distance 0 from itself; drop the rounding noise from u . u
+    np.fill_diagonal(distances, 0.0)
     
     # Calculate maximum and average distances
     max_distance = np.max(distances)
@@ -14,12 +19,13 @@ def calculate_vector_distance_metric(self) -> DivergenceMetric:
     
     # Calculate distances between each persona and the centroid
     centroid = np.mean(vectors, axis=0)
-    centroid_distances = {
-        d.persona_id: 1 - cosine_similarity(
-            np.array([d.rationale_vector]), np.array([centroid])
-        )[0][0]
-        for d in decisions_with_vectors
-    }
+    centroid_norm = np.linalg.norm(centroid)
+    if centroid_norm > 0:
+        centroid = centroid / centroid_norm
+    centroid_distances = dict(zip(
+        (d.persona_id for d in decisions_with_vectors),
+        (1 - np.dot(unit_vectors, centroid)).tolist()
+    ))
     
     return DivergenceMetric(
         type=DivergenceMetricType.VECTOR_DISTANCE,
@@ -1,29 +1,44 @@
-def calculate_agreement_metric(self) -> DivergenceMetric:
-    """Calculate agreement-based divergence metric"""
-    # Count occurrences of each unique decision
-    decision_hashes = [d.generate_decision_hash() for d in self.decisions]
-    counts = Counter(decision_hashes)
+def calculate_agreement_metric(self, decision_hashes: Optional[List[bytes]] = None) -> DivergenceMetric:
+    """Calculate agreement-based divergence metric
+    
+    decision_hashes may be passed in when already computed for the other
+    metrics; otherwise they are computed here.
+    """
+    # Count occurrences of each unique decision; the leading 64 bits of each
+    # digest serve as an integer label, so grouping sorts integers
+    if decision_hashes is None:
+        decision_hashes = [d.generate_decision_hash() for d in self.decisions]
+    hash_ids = np.fromiter(
+        (int.from_bytes(h[:8], "big") for h in decision_hashes), dtype=np.uint64, count=len(decision_hashes)
+    )
+    _, first_seen, hash_positions, counts = np.unique(
+        hash_ids, return_index=True, return_inverse=True, return_counts=True
+    )
+    
+    # Order unique decisions by frequency, ties broken by first appearance
+    cluster_order = np.lexsort((first_seen, -counts))
     
     # Find the most common decision
-    most_common_hash, most_common_count = counts.most_common(1)[0]
+    most_common_pos = cluster_order[0]
+    most_common_count = int(counts[most_common_pos])
     
     # Calculate agreement rate
     agreement_rate = most_common_count / len(self.decisions)
     
-    # Map personas to their agreement group
-    persona_agreement = {
-        d.persona_id: 1.0 if d.generate_decision_hash() == most_common_hash else 0.0
-        for d in self.decisions
-    }
+    # Map personas to their agreement group (1 for majority, 0 for others)
+    persona_ids = np.array([d.persona_id for d in self.decisions], dtype=object)
+    agreement_mask = (hash_positions == most_common_pos).astype(np.float64)
+    persona_agreement = dict(zip(persona_ids, agreement_mask.tolist()))
     
-    # Store decision clusters
-    self.decision_clusters = []
-    for hash_key, _ in counts.most_common():
-        cluster = [
-            d.persona_id for i, d in enumerate(self.decisions)
-            if decision_hashes[i] == hash_key
-        ]
-        self.decision_clusters.append(cluster)
+    # Store decision clusters: order persona IDs by hash in one stable sort
+    # (keeping decision order within each cluster) and one gather, then
+    # slice each cluster out by its offsets
+    grouped_ids = persona_ids[np.argsort(hash_positions, kind="stable")].tolist()
+    cluster_ends = np.cumsum(counts).tolist()
+    cluster_starts = [end - int(count) for end, count in zip(cluster_ends, counts)]
+    self.decision_clusters = [
+        grouped_ids[cluster_starts[pos]:cluster_ends[pos]] for pos in cluster_order.tolist()
+    ]
     
     return DivergenceMetric(
         type=DivergenceMetricType.DECISION_AGREEMENT,
@@ -5,6 +5,7 @@ class ComponentVersionRegistry:
         self.components = {}  # type_id -> {version -> instance}
         self.active_versions = {}  # type_id -> active_version
         self.deployment_status = {}  # version -> status
+        self._routing_cache = {}  # type_id -> (versions, {format -> cumulative weights})
         
     def register_component(self, component_type, version, instance, compatibility=None):
         """Register a component version"""
@@ -17,6 +18,7 @@ class ComponentVersionRegistry:
             'health': 1.0,
             'traffic_allocation': 0.0  # Start at 0%
         }
+        self._routing_cache.pop(component_type, None)
         
     def activate_version(self, component_type, version, traffic_percent=100):
         """Activate a specific version with traffic allocation"""
@@ -35,6 +37,34 @@ class ComponentVersionRegistry:
             
             # Set new version allocation
             self.components[component_type][version]['traffic_allocation'] = traffic_percent
+            self._routing_cache.pop(component_type, None)
+            
+    def _routing_weights(self, component_type, format_type=None):
+        """
+        Get routable versions and their cumulative traffic weights
+        Built once per allocation change; versions with explicit support for
+        format_type get their weight boosted by 1.5x
+        """
+        routing = self._routing_cache.get(component_type)
+        if routing is None:
+            routing = self._routing_cache[component_type] = (tuple(self.components[component_type]), {})
+        versions, cum_weights_by_format = routing
+        
+        cum_weights = cum_weights_by_format.get(format_type)
+        if cum_weights is None:
+            cum_weights = []
+            total = 0.0
+            for v in versions:
+                comp_data = self.components[component_type][v]
+                weight = comp_data['traffic_allocation']
+                if format_type is not None and format_type in comp_data.get('compatibility', {}).get('formats', []):
+                    # Prefer versions with explicit format support
+                    weight *= 1.5
+                total += weight
+                cum_weights.append(total)
+            cum_weights_by_format[format_type] = cum_weights
+        
+        return versions, cum_weights
             
     def get_component(self, component_type, preferred_version=None, context=None):
         """Get component instance with dynamic routing logic"""
@@ -48,24 +78,19 @@ class ComponentVersionRegistry:
         # Traffic splitting for canary deployment
         active_version = self.active_versions.get(component_type)
         if active_version:
-            # Check if we should route to canary based on allocation
-            versions = list(self.components[component_type].keys())
-            weights = [self.components[component_type][v]['traffic_allocation'] for v in versions]
+            # Context-aware routing (e.g., route format-specific requests):
+            # structured formats get specialized weights
+            format_type = context.get('format') if context else None
+            if format_type not in (PromptFormat.JSON, PromptFormat.SQL):
+                format_type = None
             
-            # Context-aware routing (e.g., route format-specific requests)
-            if context and 'format' in context:
-                format_type = context['format']
-                if format_type in [PromptFormat.JSON, PromptFormat.SQL]:
-                    # Specialized routing for structured formats
-                    for v in versions:
-                        comp_data = self.components[component_type][v]
-                        if (comp_data.get('compatibility', {}).get('formats', []) and 
-                            format_type in comp_data['compatibility']['formats']):
-                            # Prefer versions with explicit format support
-                            weights[versions.index(v)] *= 1.5
+            # Check if we should route to canary based on allocation
+            versions, cum_weights = self._routing_weights(component_type, format_type)
+            if cum_weights[-1] <= 0:
+                raise ValueError("Total of weights must be greater than zero")
             
             # Select version based on weights
-            selected_version = random.choices(versions, weights=weights)[0]
+            selected_version = versions[bisect.bisect_right(cum_weights, random.random() * cum_weights[-1])]
             return self.components[component_type][selected_version]['instance']
             
         # Fallback to latest registered version
@@ -96,15 +121,18 @@ class ShadowModeEvaluator:
         if not shadow_versions:
             return None
             
-        # Run active version (considered ground truth)
-        active_component = self.registry.components[component_type][active_version]['instance']
-        active_result = await self._run_component(active_component, input_data, context)
+        # Run active version (considered ground truth) and shadow versions concurrently
+        components = self.registry.components[component_type]
+        active_result, *shadow_outputs = await asyncio.gather(
+            self._run_component(components[active_version]['instance'], input_data, context),
+            *(
+                self._run_component(components[version]['instance'], input_data, context)
+                for version in shadow_versions
+            )
+        )
         
-        # Run shadow versions in parallel
         shadow_results = {}
-        for version in shadow_versions:
-            shadow_component = self.registry.components[component_type][version]['instance']
-            shadow_result = await self._run_component(shadow_component, input_data, context)
+        for version, shadow_result in zip(shadow_versions, shadow_outputs):
             shadow_results[version] = shadow_result
             
             # Compare results and detect anomalies
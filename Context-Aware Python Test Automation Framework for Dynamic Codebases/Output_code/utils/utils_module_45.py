@@ -78,14 +78,27 @@ class ParallelArbitrationEngine:
         
         while received < expected_count:
             try:
-                result = result_queue.get(timeout=30)  # 30-second timeout
-                if result is not None:
-                    future.add_result(result)
-                    received += 1
+                # Block only while nothing is ready; a short timeout notices stop() promptly
+                result = result_queue.get(timeout=1.0)
             except queue.Empty:
                 # Check if we should continue waiting
                 if not self.running:
                     break
+                continue
+                
+            if result is not None:
+                future.add_result(result)
+                received += 1
+                
+            # Drain whatever else has already arrived without blocking
+            while received < expected_count:
+                try:
+                    result = result_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if result is not None:
+                    future.add_result(result)
+                    received += 1
                     
         future.set_complete()
         
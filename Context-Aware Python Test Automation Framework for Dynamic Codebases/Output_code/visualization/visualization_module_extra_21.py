@@ -1,18 +1,48 @@
 from typing import Dict, List, Any, Optional, Tuple, Set, Union, Callable, TypeVar
 from dataclasses import dataclass, field
+from functools import cached_property
 from enum import Enum, auto
 import numpy as np
 import asyncio
+import os
 import json
+import pickle
+import sqlite3
+import tempfile
+import threading
 import hashlib
 import datetime
-import scipy.stats
-from sklearn.metrics.pairwise import cosine_similarity
-from collections import Counter, defaultdict
-import matplotlib.pyplot as plt
+import time
+import logging
+import logging.handlers
+import queue
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from io import BytesIO
 import base64
 
+try:
+    from numba import njit, prange
+except ImportError:
+    # numba not available
+    njit = None
+
+logger = logging.getLogger(__name__)
+
+def enable_queued_logging(*handlers: logging.Handler) -> logging.handlers.QueueListener:
+    """Route this module's records through a queue drained by a listener thread (opt-in)"""
+    # Callers (often the event loop) then only enqueue; the listener writes to
+    # the given handlers, stderr by default, instead of propagating. Stop the
+    # returned listener at shutdown to flush it
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, *(handlers or (logging.StreamHandler(),)), respect_handler_level=True
+    )
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.propagate = False
+    listener.start()
+    return listener
+
 class DivergenceMetricType(Enum):
     """Types of divergence metrics"""
     ENTROPY = auto()           # Information-theoretic entropy of mutation decisions
@@ -22,9 +52,10 @@ class DivergenceMetricType(Enum):
     CONSTRAINT_VIOLATION = auto() # Different constraint violations observed
     SEMANTIC_DRIFT = auto()    # Semantic drift from original prompt
 
-@dataclass
+@dataclass(slots=True)
 class PersonaDecision:
     """Represents a decision made by a persona during mutation simulation"""
+    # Slotted: one instance per persona per mutation, with no per-instance __dict__
     persona_id: str
     persona_type: PersonaType
     mutation_id: str
@@ -32,15 +63,61 @@ class PersonaDecision:
     mutated_prompt: str
     confidence: float
     explanation: str
-    rationale_vector: Optional[List[float]] = None  # Embedding of explanation
+    rationale_vector: Optional[Union[List[float], np.ndarray]] = None  # Embedding of explanation (float32 once embedded)
     constraint_scores: Dict[str, float] = field(default_factory=dict)
     tags: List[str] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    _normalized_vector: Optional[Tuple[Any, np.ndarray, float]] = field(default=None, init=False, repr=False, compare=False)
+    # Memoized digests, each stored with the field values it was computed from
+    _cached_hash: Optional[Tuple[str, float, bytes]] = field(default=None, init=False, repr=False, compare=False)
+    _mutated_hash: Optional[Tuple[str, str]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def generate_decision_hash(self) -> bytes:
+        """Generate a hash representing the core decision (computed once per decision)"""
+        cached = self._cached_hash
+        if cached is None or cached[0] is not self.mutated_prompt or cached[1] != self.confidence:
+            decision_text = f"{self.mutated_prompt}:{self.confidence}"
+            # Only used as a grouping key, so a 128-bit BLAKE2b digest suffices
+            digest = hashlib.blake2b(decision_text.encode(), digest_size=16).digest()
+            cached = self._cached_hash = (self.mutated_prompt, self.confidence, digest)
+        return cached[2]
+    
+    @property
+    def mutated_hash(self) -> str:
+        """Hash of the mutated prompt, computed once per decision"""
+        cached = self._mutated_hash
+        if cached is None or cached[0] is not self.mutated_prompt:
+            cached = self._mutated_hash = (
+                self.mutated_prompt, hashlib.sha256(self.mutated_prompt.encode()).hexdigest()
+            )
+        return cached[1]
+    
+    def _normalize_vector(self) -> Optional[Tuple[Any, np.ndarray, float]]:
+        """Cache the unit rationale vector and its norm until the vector is replaced"""
+        vector = self.rationale_vector
+        if vector is None:
+            return None
+        
+        if self._normalized_vector is None or self._normalized_vector[0] is not vector:
+            # float32 embeddings stay float32; anything else is promoted to float64
+            values = np.asarray(vector)
+            values = values.astype(np.result_type(values.dtype, np.float32), copy=False)
+            norm = float(np.linalg.norm(values))
+            # Zero vectors stay zero, giving 0 similarity to everything
+            self._normalized_vector = (vector, values / norm if norm > 0 else values, norm)
+        return self._normalized_vector
+    
+    @property
+    def rationale_vector_normalized(self) -> Optional[np.ndarray]:
+        """Unit-length rationale vector"""
+        cached = self._normalize_vector()
+        return cached[1] if cached else None
     
-    def generate_decision_hash(self) -> str:
-        """Generate a hash representing the core decision"""
-        decision_text = f"{self.mutated_prompt}:{self.confidence}"
-        return hashlib.sha256(decision_text.encode()).hexdigest()
+    @property
+    def rationale_vector_norm(self) -> float:
+        """L2 norm of the rationale vector (0.0 when absent)"""
+        cached = self._normalize_vector()
+        return cached[2] if cached else 0.0
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
@@ -75,6 +152,138 @@ class DivergenceMetric:
             "explanation": self.explanation
         }
 
+def _copy_metric(metric: DivergenceMetric) -> DivergenceMetric:
+    """Copy a metric so cached and live analyses never share its component mapping"""
+    return DivergenceMetric(
+        type=metric.type,
+        value=metric.value,
+        component_values=dict(metric.component_values),
+        explanation=metric.explanation
+    )
+
+@dataclass
+class _DecisionColumns:
+    """Column-oriented view of a decision set, shared by the divergence metrics"""
+    persona_ids: np.ndarray  # Persona ID per decision (object array)
+    first_seen: np.ndarray  # First decision index of each unique decision
+    counts: np.ndarray  # Occurrences of each unique decision
+    hash_positions: np.ndarray  # Unique decision id per decision
+    vector_rows: np.ndarray  # Indices of decisions that have rationale vectors
+    unit_vectors: np.ndarray  # Unit rationale vectors for those decisions
+    vector_norms: np.ndarray  # Original norms of those vectors
+    constraint_names: List[str]  # Sorted constraint keys
+    constraint_matrix: np.ndarray  # Decision x constraint scores, NaN where absent
+
+def _quantize_rows(vectors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Symmetric int8 quantization of each row, with one scale per row"""
+    scales = np.abs(vectors).max(axis=1).astype(np.float32)
+    safe_scales = np.where(scales > 0, scales, 1.0).astype(np.float32)
+    quantized = np.rint(vectors * (127.0 / safe_scales)[:, None]).astype(np.int8)
+    return quantized, scales
+
+# Rows per block when reducing pairwise similarities
+_SIMILARITY_BLOCK_ROWS = 256
+
+def _min_pairwise_similarity(vectors: np.ndarray, 
+                             quantize: bool = False,
+                             block_rows: int = _SIMILARITY_BLOCK_ROWS) -> float:
+    """
+    Smallest dot product between distinct rows (inf with fewer than two rows)
+    
+    Products are taken one block of rows at a time against the rows after
+    them, so at most block_rows x N similarities exist at once. With
+    quantize, products come from int8 codes accumulated in int32.
+    """
+    if quantize:
+        quantized, scales = _quantize_rows(vectors)
+        # 127 * 127 * dimension stays well within int32 range
+        codes = quantized.astype(np.int32)
+        scales = scales / np.float32(127)
+    else:
+        codes, scales = vectors, None
+    
+    smallest = np.inf
+    for start in range(0, len(codes) - 1, block_rows):
+        block = codes[start:start + block_rows]
+        products = block @ codes[start + 1:].T
+        if scales is not None:
+            products = products.astype(np.float32) * np.outer(
+                scales[start:start + len(block)], scales[start + 1:]
+            )
+        else:
+            products = products.astype(np.float64, copy=False)
+        # Column c is row start + 1 + c, so pairs at or below the diagonal
+        # (c < r) are repeats or self-pairs
+        products[np.tril_indices(len(block), k=-1, m=products.shape[1])] = np.inf
+        smallest = min(smallest, float(products.min()))
+    return smallest
+
+# Columns from which spreading the variance kernel over threads pays for
+# the thread start-up
+_PARALLEL_NANVAR_MIN_COLUMNS = 64
+
+if njit is not None:
+    def _column_nanvar_loops(matrix: np.ndarray) -> np.ndarray:
+        """Population variance of each column, skipping NaN entries"""
+        rows, cols = matrix.shape
+        variances = np.empty(cols)
+        # Each column writes only its own slot, so columns can run in parallel
+        for j in prange(cols):
+            total = 0.0
+            count = 0
+            for i in range(rows):
+                value = matrix[i, j]
+                if not np.isnan(value):
+                    total += value
+                    count += 1
+            if count == 0:
+                variances[j] = np.nan
+            else:
+                mean = total / count
+                squares = 0.0
+                for i in range(rows):
+                    value = matrix[i, j]
+                    if not np.isnan(value):
+                        squares += (value - mean) * (value - mean)
+                variances[j] = squares / count
+        return variances
+    
+    # prange runs as a plain range in the serial build
+    _column_nanvar_kernel = njit(cache=True)(_column_nanvar_loops)
+    _column_nanvar_parallel_kernel = njit(parallel=True)(_column_nanvar_loops)
+
+def _column_nanvar(matrix: np.ndarray) -> np.ndarray:
+    """Per-column variance ignoring NaN, through a Numba kernel when available"""
+    global _column_nanvar_parallel_kernel
+    if njit is None:
+        return np.nanvar(matrix, axis=0)
+    
+    # Column-major layout makes each column sweep contiguous
+    matrix = np.asfortranarray(matrix, dtype=np.float64)
+    if matrix.shape[1] >= _PARALLEL_NANVAR_MIN_COLUMNS and _column_nanvar_parallel_kernel is not None:
+        try:
+            return _column_nanvar_parallel_kernel(matrix)
+        except Exception:
+            # Parallel build unavailable (e.g. no threading layer); stick to the serial one
+            logger.exception("Parallel constraint variance unavailable, using serial kernel")
+            _column_nanvar_parallel_kernel = None
+    return _column_nanvar_kernel(matrix)
+
+# Figure reused across visual analyses, avoiding per-call figure and canvas setup
+_ANALYSIS_FIGURE = None
+
+def _analysis_figure():
+    """Return the shared analysis figure, cleared for a new plot"""
+    global _ANALYSIS_FIGURE
+    if _ANALYSIS_FIGURE is None:
+        # Imported on first use so loading this module doesn't pull in
+        # matplotlib; a standalone Figure renders through Agg without pyplot
+        from matplotlib.figure import Figure
+        _ANALYSIS_FIGURE = Figure(figsize=(12, 10))
+    else:
+        _ANALYSIS_FIGURE.clear()
+    return _ANALYSIS_FIGURE
+
 @dataclass
 class PersonaDivergenceAnalysis:
     """Analysis of divergence between multiple persona decisions"""
@@ -86,42 +295,150 @@ class PersonaDivergenceAnalysis:
     agreement_rate: float = 0.0
     max_vector_distance: float = 0.0
     timestamp: datetime.datetime = field(default_factory=datetime.datetime.now)
+    quantize_vectors: bool = False  # Compute rationale similarities from int8 codes
+    _persona_cluster_idx: Optional[Dict[str, int]] = field(default=None, init=False, repr=False, compare=False)
+    _equal_weights: Optional[Dict[str, float]] = field(default=None, init=False, repr=False, compare=False)
+    
+    @property
+    def persona_cluster_index(self) -> Dict[str, int]:
+        """Reverse index mapping each persona ID to its position in decision_clusters"""
+        if self._persona_cluster_idx is None:
+            self._persona_cluster_idx = {
+                pid: i for i, cluster in enumerate(self.decision_clusters) for pid in cluster
+            }
+        return self._persona_cluster_idx
+    
+    @property
+    def equal_normalized_weights(self) -> Dict[str, float]:
+        """
+        Equal, normalized weight for each persona that made a decision
+        Computed with the metrics, so it describes the same decisions they do
+        """
+        if self._equal_weights is None:
+            return self._compute_equal_weights()
+        return self._equal_weights
+    
+    def _compute_equal_weights(self) -> Dict[str, float]:
+        persona_ids = dict.fromkeys(d.persona_id for d in self.decisions)
+        weight = 1.0 / len(persona_ids) if persona_ids else 0.0
+        return {pid: weight for pid in persona_ids}
+    
+    def _build_decision_columns(self) -> _DecisionColumns:
+        """Collect everything the metrics read from the decisions in a single pass"""
+        decision_count = len(self.decisions)
+        hash_ids = np.empty(decision_count, dtype=np.uint64)
+        persona_ids = np.empty(decision_count, dtype=object)
+        vector_rows, unit_vectors, vector_norms = [], [], []
+        constraint_entries = []
+        
+        for i, d in enumerate(self.decisions):
+            # The leading 64 bits of each decision digest identify the decision,
+            # so grouping sorts fixed-width integers rather than byte strings
+            hash_ids[i] = int.from_bytes(d.generate_decision_hash()[:8], "big")
+            persona_ids[i] = d.persona_id
+            
+            if d.rationale_vector is not None:
+                vector_rows.append(i)
+                unit_vectors.append(d.rationale_vector_normalized)
+                vector_norms.append(d.rationale_vector_norm)
+            
+            for constraint, score in d.constraint_scores.items():
+                constraint_entries.append((i, constraint, score))
+        
+        _, first_seen, hash_positions, counts = np.unique(
+            hash_ids, return_index=True, return_inverse=True, return_counts=True
+        )
+        
+        # Lay scores out as a decision x constraint matrix, NaN where a
+        # decision has no score for a constraint
+        constraint_names = sorted({constraint for _, constraint, _ in constraint_entries})
+        constraint_index = {c: j for j, c in enumerate(constraint_names)}
+        constraint_matrix = np.full((decision_count, len(constraint_names)), np.nan)
+        for row, constraint, score in constraint_entries:
+            constraint_matrix[row, constraint_index[constraint]] = score
+        
+        return _DecisionColumns(
+            persona_ids=persona_ids,
+            first_seen=first_seen,
+            counts=counts,
+            hash_positions=hash_positions,
+            vector_rows=np.asarray(vector_rows, dtype=np.intp),
+            unit_vectors=np.array(unit_vectors),
+            vector_norms=np.asarray(vector_norms, dtype=np.float64),
+            constraint_names=constraint_names,
+            constraint_matrix=constraint_matrix
+        )
     
-    def calculate_all_metrics(self) -> Dict[DivergenceMetricType, DivergenceMetric]:
+    def _decision_set_key(self) -> bytes:
+        """Content digest of everything the metrics read from the decisions"""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(b"q" if self.quantize_vectors else b"f")
+        for d in self.decisions:
+            digest.update(d.generate_decision_hash())
+            digest.update(f"{d.persona_id}\0{sorted(d.constraint_scores.items())!r}\0".encode())
+            if d.rationale_vector is not None:
+                digest.update(np.asarray(d.rationale_vector, dtype=np.float64).tobytes())
+            digest.update(b"\1")
+        return digest.digest()
+    
+    def calculate_all_metrics(self, 
+                              metrics_cache: Optional["BoundedTTLCache"] = None) -> Dict[DivergenceMetricType, DivergenceMetric]:
         """Calculate all divergence metrics"""
-        self.metrics[DivergenceMetricType.ENTROPY] = self.calculate_entropy_metric()
-        self.metrics[DivergenceMetricType.DECISION_AGREEMENT] = self.calculate_agreement_metric()
-        self.metrics[DivergenceMetricType.VECTOR_DISTANCE] = self.calculate_vector_distance_metric()
-        self.metrics[DivergenceMetricType.CONSTRAINT_VIOLATION] = self.calculate_constraint_violation_metric()
+        # Identical decision sets (e.g. re-analysis across strategy comparisons)
+        # are served from the caller's metrics cache, as private copies
+        cached = None
+        if metrics_cache is not None:
+            key = self._decision_set_key()
+            cached = metrics_cache.get(key)
+        if cached is not None:
+            metrics, clusters = cached
+            self.metrics.update({t: _copy_metric(m) for t, m in metrics.items()})
+            self.decision_clusters = [list(cluster) for cluster in clusters]
+            self._persona_cluster_idx = None
+        else:
+            # One pass over the decisions feeds all four metrics
+            columns = self._build_decision_columns()
+            self.metrics[DivergenceMetricType.ENTROPY] = self.calculate_entropy_metric(columns)
+            self.metrics[DivergenceMetricType.DECISION_AGREEMENT] = self.calculate_agreement_metric(columns)
+            self.metrics[DivergenceMetricType.VECTOR_DISTANCE] = self.calculate_vector_distance_metric(columns)
+            self.metrics[DivergenceMetricType.CONSTRAINT_VIOLATION] = self.calculate_constraint_violation_metric(columns)
+            if metrics_cache is not None:
+                metrics_cache[key] = (
+                    {t: _copy_metric(m) for t, m in self.metrics.items()},
+                    tuple(tuple(cluster) for cluster in self.decision_clusters)
+                )
+        
         self.entropy = self.metrics[DivergenceMetricType.ENTROPY].value
         self.agreement_rate = self.metrics[DivergenceMetricType.DECISION_AGREEMENT].value
+        self._equal_weights = self._compute_equal_weights()
+        
+        # Any previously rendered visualization reflects the old metrics
+        self.__dict__.pop("visualization_png", None)
         
         return self.metrics
     
-    def calculate_entropy_metric(self) -> DivergenceMetric:
+    def calculate_entropy_metric(self, columns: Optional[_DecisionColumns] = None) -> DivergenceMetric:
         """Calculate entropy-based divergence metric"""
-        # Group decisions by their core decision hash
-        decision_hashes = [d.generate_decision_hash() for d in self.decisions]
-        counts = Counter(decision_hashes)
+        if columns is None:
+            columns = self._build_decision_columns()
         
-        # Calculate probabilities
-        total = len(decision_hashes)
-        probabilities = [count/total for count in counts.values()]
+        # Decisions are grouped by their core decision hash
+        counts, hash_positions = columns.counts, columns.hash_positions
         
-        # Calculate entropy using scipy
-        entropy = scipy.stats.entropy(probabilities, base=2)
+        # Calculate probabilities and entropy (in bits); every unique decision
+        # occurs at least once, so no zero-probability guard is needed
+        probabilities = np.divide(counts, len(hash_positions), dtype=np.float64)
+        log_probabilities = np.log2(probabilities)
+        entropy = -float(probabilities @ log_probabilities)
         
         # Max possible entropy for this number of decisions
         max_entropy = np.log2(min(len(self.decisions), len(counts)))
         normalized_entropy = entropy / max_entropy if max_entropy > 0 else 0
         
-        # Track individual contribution to entropy
-        persona_contributions = {}
-        for i, decision in enumerate(self.decisions):
-            hash_key = decision_hashes[i]
-            probability = counts[hash_key] / total
-            information_content = -np.log2(probability)
-            persona_contributions[decision.persona_id] = information_content
+        # Track individual contribution to entropy: information content of
+        # each persona's decision, looked up through its hash position
+        information_content = -log_probabilities[hash_positions]
+        persona_contributions = dict(zip(columns.persona_ids, information_content.tolist()))
         
         return DivergenceMetric(
             type=DivergenceMetricType.ENTROPY,
@@ -131,38 +448,42 @@ class PersonaDivergenceAnalysis:
                        f"Higher value indicates more diverse decisions."
         )
     
-    def calculate_agreement_metric(self) -> DivergenceMetric:
+    def calculate_agreement_metric(self, columns: Optional[_DecisionColumns] = None) -> DivergenceMetric:
         """Calculate agreement-based divergence metric"""
-        # Count occurrences of each unique decision
-        decision_hashes = [d.generate_decision_hash() for d in self.decisions]
-        counts = Counter(decision_hashes)
+        if columns is None:
+            columns = self._build_decision_columns()
+        
+        # Occurrences of each unique decision
+        counts, hash_positions, persona_ids = columns.counts, columns.hash_positions, columns.persona_ids
+        
+        # Order unique decisions by frequency, ties broken by first appearance
+        cluster_order = np.lexsort((columns.first_seen, -counts))
         
         # Find the most common decision
-        most_common_hash, most_common_count = counts.most_common(1)[0]
+        most_common_pos = cluster_order[0]
+        most_common_count = int(counts[most_common_pos])
         
         # Calculate agreement rate
         agreement_rate = most_common_count / len(self.decisions)
         
-        # Identify which personas agreed on the most common decision
-        agreed_personas = [
-            d.persona_id for i, d in enumerate(self.decisions) 
-            if decision_hashes[i] == most_common_hash
-        ]
-        
         # Map all personas to their agreement group (1 for majority, 0 for others)
-        persona_agreement = {
-            d.persona_id: 1.0 if d.generate_decision_hash() == most_common_hash else 0.0
-            for d in self.decisions
-        }
+        persona_agreement = dict(zip(
+            persona_ids,
+            (hash_positions == most_common_pos).astype(np.float64).tolist()
+        ))
+        
+        # Store the clusters for later use: order persona IDs by hash in one
+        # stable sort (keeping decision order within each cluster) and one
+        # gather, then slice each cluster out by its offsets
+        grouped_ids = persona_ids[np.argsort(hash_positions, kind="stable")].tolist()
+        cluster_ends = np.cumsum(counts).tolist()
+        cluster_starts = [end - int(count) for end, count in zip(cluster_ends, counts)]
+        self.decision_clusters = [
+            grouped_ids[cluster_starts[pos]:cluster_ends[pos]] for pos in cluster_order.tolist()
+        ]
         
-        # Store the clusters for later use
-        self.decision_clusters = []
-        for hash_key, _ in counts.most_common():
-            cluster = [
-                d.persona_id for i, d in enumerate(self.decisions)
-                if decision_hashes[i] == hash_key
-            ]
-            self.decision_clusters.append(cluster)
+        # Clusters changed, so the reverse index is rebuilt on next access
+        self._persona_cluster_idx = None
         
         return DivergenceMetric(
             type=DivergenceMetricType.DECISION_AGREEMENT,
@@ -172,37 +493,61 @@ class PersonaDivergenceAnalysis:
                        f"{most_common_count} of {len(self.decisions)} personas agreed on the same decision."
         )
     
-    def calculate_vector_distance_metric(self) -> DivergenceMetric:
+    def calculate_vector_distance_metric(self, columns: Optional[_DecisionColumns] = None) -> DivergenceMetric:
         """Calculate vector distance-based divergence metric"""
-        # Filter decisions with vectors
-        decisions_with_vectors = [d for d in self.decisions if d.rationale_vector is not None]
+        if columns is None:
+            columns = self._build_decision_columns()
         
-        if len(decisions_with_vectors) < 2:
+        # Only decisions with vectors take part
+        if len(columns.vector_rows) < 2:
             return DivergenceMetric(
                 type=DivergenceMetricType.VECTOR_DISTANCE,
                 value=0.0,
                 explanation="Insufficient vector data for distance calculation."
             )
         
-        # Calculate pairwise distances
-        vectors = np.array([d.rationale_vector for d in decisions_with_vectors])
-        similarities = cosine_similarity(vectors)
+        # Personas often share identical rationale vectors, so collapse
+        # duplicate rows and weight the unique ones by how often they occur
+        unit_vectors, norms = columns.unit_vectors, columns.vector_norms
+        vector_count = len(norms)
+        _, unique_rows, row_positions, row_counts = np.unique(
+            np.column_stack((unit_vectors, norms)), axis=0,
+            return_index=True, return_inverse=True, return_counts=True
+        )
+        unique_vectors = unit_vectors[unique_rows]
         
-        # Convert similarities to distances (1 - similarity)
-        distances = 1 - similarities
+        # Maximum pairwise distance (1 - cosine similarity) over distinct
+        # unique vectors, reduced block by block without the full matrix;
+        # pairs of duplicates are at distance 0
+        min_similarity = _min_pairwise_similarity(unique_vectors, quantize=self.quantize_vectors)
+        max_distance = 1 - min_similarity if np.isfinite(min_similarity) else 0.0
+        if len(unique_rows) < vector_count:
+            max_distance = max(max_distance, 0.0)
         
-        # Calculate maximum and average distances
-        max_distance = np.max(distances)
-        avg_distance = np.mean(distances)
+        # Average distance over distinct decision pairs, so self-pairs don't
+        # pull it toward 0. A unique pair (a, b) stands for count_a * count_b
+        # decision pairs, and sum over a < b of count_a * count_b * u_a . u_b
+        # is (|sum of count * u|^2 - sum of count^2 * |u|^2) / 2, so it needs
+        # only one weighted sum of the vectors
+        counted_sum = row_counts @ unique_vectors
+        unit_lengths = np.einsum("ij,ij->i", unique_vectors, unique_vectors)
+        pair_similarity = (float(counted_sum @ counted_sum) - float(row_counts ** 2 @ unit_lengths)) / 2
+        pair_total = (vector_count ** 2 - float(row_counts @ row_counts)) / 2
+        avg_distance = (pair_total - pair_similarity) / (vector_count * (vector_count - 1) / 2)
         
-        # Calculate distances between each persona and the centroid
-        centroid = np.mean(vectors, axis=0)
-        centroid_distances = {
-            d.persona_id: 1 - cosine_similarity(
-                np.array([d.rationale_vector]), np.array([centroid])
-            )[0][0]
-            for d in decisions_with_vectors
-        }
+        # Calculate distances between each persona and the centroid (mean of
+        # the raw vectors, r_j = norm_j * u_j), one product over the unique
+        # vectors
+        centroid = (row_counts * norms[unique_rows]) @ unique_vectors
+        centroid_norm = float(np.linalg.norm(centroid))
+        centroid_similarities = (
+            unique_vectors @ (centroid / centroid_norm) if centroid_norm > 0 
+            else np.zeros(len(unique_rows))
+        )
+        centroid_distances = dict(zip(
+            columns.persona_ids[columns.vector_rows],
+            (1 - centroid_similarities[row_positions.reshape(-1)]).tolist()
+        ))
         
         return DivergenceMetric(
             type=DivergenceMetricType.VECTOR_DISTANCE,
@@ -212,13 +557,12 @@ class PersonaDivergenceAnalysis:
                        f"Higher values indicate more diverse explanations."
         )
     
-    def calculate_constraint_violation_metric(self) -> DivergenceMetric:
+    def calculate_constraint_violation_metric(self, columns: Optional[_DecisionColumns] = None) -> DivergenceMetric:
         """Calculate constraint violation divergence metric"""
-        # Collect all constraint keys
-        all_constraints = set()
-        for decision in self.decisions:
-            all_constraints.update(decision.constraint_scores.keys())
+        if columns is None:
+            columns = self._build_decision_columns()
         
+        all_constraints = columns.constraint_names
         if not all_constraints:
             return DivergenceMetric(
                 type=DivergenceMetricType.CONSTRAINT_VIOLATION,
@@ -226,17 +570,9 @@ class PersonaDivergenceAnalysis:
                 explanation="No constraint data available."
             )
         
-        # For each constraint, calculate variance in scores
-        constraint_variances = {}
-        for constraint in all_constraints:
-            scores = [
-                d.constraint_scores.get(constraint, 0.0) 
-                for d in self.decisions 
-                if constraint in d.constraint_scores
-            ]
-            
-            if scores:
-                constraint_variances[constraint] = np.var(scores)
+        # Variance in scores for every constraint in one reduction; each
+        # constraint has at least one score, so no column is all-NaN
+        constraint_variances = dict(zip(all_constraints, _column_nanvar(columns.constraint_matrix).tolist()))
         
         # Average variance across all constraints
         avg_variance = np.mean(list(constraint_variances.values())) if constraint_variances else 0.0
@@ -266,8 +602,9 @@ class PersonaDivergenceAnalysis:
     def generate_visual_analysis(self) -> Optional[str]:
         """Generate a visual representation of the divergence analysis"""
         try:
-            # Create a figure with multiple subplots
-            fig, axes = plt.subplots(2, 2, figsize=(12, 10))
+            # Lay out multiple subplots on the shared figure
+            fig = _analysis_figure()
+            axes = fig.subplots(2, 2)
             fig.suptitle(f"Persona Divergence Analysis for Mutation {self.mutation_id}", fontsize=16)
             
             # Plot 1: Entropy by persona
@@ -322,21 +659,32 @@ class PersonaDivergenceAnalysis:
                     axes[1, 1].set_ylabel("Variance")
                     axes[1, 1].tick_params(axis='x', rotation=45)
             
-            plt.tight_layout()
+            fig.tight_layout()
             
             # Convert plot to base64 string
             buffer = BytesIO()
-            plt.savefig(buffer, format='png')
-            plt.close(fig)
+            fig.savefig(buffer, format='png')
             buffer.seek(0)
             image_base64 = base64.b64encode(buffer.getvalue()).decode('utf-8')
             
             return image_base64
             
-        except Exception as e:
-            print(f"Error generating visual analysis: {e}")
+        except Exception:
+            logger.exception("Error generating visual analysis")
             return None
     
+    @cached_property
+    def visualization_png(self) -> Optional[str]:
+        """Base64 PNG of the visual analysis, rendered on first access"""
+        # Re-analyses of the same decisions reuse the image rendered for them
+        key = (self.mutation_id, self._decision_set_key(), frozenset(self.metrics))
+        image = _VISUALIZATION_CACHE.get(key)
+        if image is None:
+            image = self.generate_visual_analysis()
+            if image is not None:
+                _VISUALIZATION_CACHE[key] = image
+        return image
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
         return {
@@ -351,18 +699,24 @@ class PersonaDivergenceAnalysis:
             # Don't include full decisions in the summary for efficiency
         }
     
-    def detailed_report(self) -> Dict[str, Any]:
+    def detailed_report(self, include_visualization: bool = False) -> Dict[str, Any]:
         """Generate a detailed report with all data"""
         report = self.to_dict()
         report["decisions"] = [d.to_dict() for d in self.decisions]
-        report["visualization"] = self.generate_visual_analysis()
+        
+        # Rendering the figure dominates report cost, so only do it on request
+        if include_visualization:
+            report["visualization"] = self.visualization_png
+        
+        # Index decisions by persona once; reversed so the first decision wins
+        decisions_by_persona = {d.persona_id: d for d in reversed(self.decisions)}
         
         # Add decision clusters with their members
         cluster_details = []
         for i, cluster in enumerate(self.decision_clusters):
             # Find a representative decision from this cluster
             rep_persona_id = cluster[0] if cluster else None
-            rep_decision = next((d for d in self.decisions if d.persona_id == rep_persona_id), None)
+            rep_decision = decisions_by_persona.get(rep_persona_id)
             
             if rep_decision:
                 cluster_details.append({
@@ -375,35 +729,365 @@ class PersonaDivergenceAnalysis:
         
         report["cluster_details"] = cluster_details
         return report
+    
+    def write_detailed_report(self, fp: Any, include_visualization: bool = False) -> None:
+        """
+        Serialize the detailed report as JSON straight to a binary file
+        Decision dicts are the cached per-decision ones, and NumPy values
+        are encoded natively rather than converted first
+        """
+        report = self.detailed_report(include_visualization=include_visualization)
+        
+        try:
+            import orjson
+        except ImportError:
+            # orjson not available
+            fp.write(json.dumps(report, default=self._json_default).encode("utf-8"))
+            return
+        
+        fp.write(orjson.dumps(
+            report,
+            default=self._json_default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        ))
+    
+    def _json_default(self, obj: Any) -> Any:
+        """Encode NumPy values for JSON output"""
+        if isinstance(obj, np.ndarray):
+            return obj.tolist()
+        if isinstance(obj, np.generic):
+            return obj.item()
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+class BoundedTTLCache:
+    """LRU cache bounded by entry count, with entries expiring after a TTL"""
+    
+    def __init__(self, max_size: int = 10000, ttl_seconds: float = 3600.0):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict = OrderedDict()  # Maps key -> (expires_at, value)
+        self.stats = {
+            "cache_hits": 0,
+            "cache_misses": 0,
+            "evictions": 0
+        }
+    
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Get a live entry, refreshing its recency"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats["cache_misses"] += 1
+            return default
+        
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.stats["cache_misses"] += 1
+            return default
+        
+        self._entries.move_to_end(key)
+        self.stats["cache_hits"] += 1
+        return value
+    
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        
+        # Evict least recently used entries beyond the bound
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+    
+    def __contains__(self, key: Any) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and entry[0] > time.monotonic()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+@dataclass(slots=True, frozen=True)
+class SimulationSummary:
+    """Headline divergence figures for one simulated mutation"""
+    entropy: float
+    agreement_rate: float
+    variant_count: int
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "entropy": self.entropy,
+            "agreement_rate": self.agreement_rate,
+            "variant_count": self.variant_count
+        }
+
+@dataclass(slots=True, frozen=True)
+class SimulationRecord:
+    """A persona simulation of one mutation, holding its decision objects rather than their dicts"""
+    mutation_id: str
+    decisions: List[PersonaDecision]
+    divergence_analysis: Dict[str, Any]
+    summary: SimulationSummary
+    
+    @property
+    def persona_count(self) -> int:
+        return len(self.decisions)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the simulation result dictionary returned to callers"""
+        return {
+            "mutation_id": self.mutation_id,
+            "persona_count": self.persona_count,
+            "decisions": [d.to_dict() for d in self.decisions],
+            "divergence_analysis": self.divergence_analysis,
+            "summary": self.summary.to_dict()
+        }
+
+class SimulationResultStore:
+    """Simulation results persisted in SQLite, with an LRU of hot entries kept in memory"""
+    
+    def __init__(self, path: Optional[str] = None, max_hot: int = 512):
+        self._owns_path = path is None
+        if path is None:
+            # Keep results on disk even when no location is configured; the file is removed on close
+            fd, path = tempfile.mkstemp(prefix="persona_simulations_", suffix=".sqlite3")
+            os.close(fd)
+        self.path = path
+        self.max_hot = max_hot
+        self._hot: OrderedDict = OrderedDict()  # Maps mutation_id -> SimulationRecord
+        self._unpersisted: Dict[str, SimulationRecord] = {}  # Records that could not be pickled
+        self._versions: Dict[str, int] = {}  # Latest write issued per mutation_id
+        self._lock = threading.Lock()  # Writes may run on a worker thread
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS simulation_results ("
+            "mutation_id TEXT PRIMARY KEY, payload BLOB NOT NULL)"
+        )
+        self._db.commit()
+    
+    def set(self, mutation_id: str, record: SimulationRecord) -> None:
+        """Persist a simulation record"""
+        self._persist(mutation_id, record, self._remember_write(mutation_id, record))
+    
+    async def set_async(self, mutation_id: str, record: SimulationRecord) -> None:
+        """Persist a simulation record, pickling and writing it off the event loop"""
+        version = self._remember_write(mutation_id, record)
+        await asyncio.to_thread(self._persist, mutation_id, record, version)
+    
+    def _remember_write(self, mutation_id: str, record: SimulationRecord) -> int:
+        """Make the record hot and return the write version it must persist under"""
+        self._remember(mutation_id, record)
+        with self._lock:
+            version = self._versions.get(mutation_id, 0) + 1
+            self._versions[mutation_id] = version
+        return version
+    
+    def _persist(self, mutation_id: str, record: SimulationRecord, version: int) -> None:
+        try:
+            payload = pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            # e.g. unpicklable execution metrics; keep the record in memory instead
+            logger.warning("Simulation result for %s could not be pickled; keeping it in memory",
+                           mutation_id, exc_info=True)
+            payload = None
+        
+        with self._lock:
+            # A later write for the same id has been issued; let it win regardless of thread order
+            if self._versions.get(mutation_id) != version:
+                return
+            if payload is None:
+                self._unpersisted[mutation_id] = record
+                return
+            with self._db:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO simulation_results (mutation_id, payload) VALUES (?, ?)",
+                    (mutation_id, payload)
+                )
+            self._unpersisted.pop(mutation_id, None)
+    
+    def get(self, mutation_id: str) -> Optional[SimulationRecord]:
+        """Get a simulation record, loading it from disk if it is not hot"""
+        entry = self._hot.get(mutation_id)
+        if entry is not None:
+            self._hot.move_to_end(mutation_id)
+            return entry
+        
+        with self._lock:
+            entry = self._unpersisted.get(mutation_id)
+            if entry is not None:
+                return entry
+            row = self._db.execute(
+                "SELECT payload FROM simulation_results WHERE mutation_id = ?", (mutation_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        
+        entry = pickle.loads(row[0])
+        self._remember(mutation_id, entry)
+        return entry
+    
+    def _remember(self, mutation_id: str, entry: SimulationRecord) -> None:
+        self._hot[mutation_id] = entry
+        self._hot.move_to_end(mutation_id)
+        
+        # Drop least recently used entries from memory; they stay on disk
+        while len(self._hot) > self.max_hot:
+            self._hot.popitem(last=False)
+    
+    def __contains__(self, mutation_id: str) -> bool:
+        if mutation_id in self._hot:
+            return True
+        with self._lock:
+            if mutation_id in self._unpersisted:
+                return True
+            return self._db.execute(
+                "SELECT 1 FROM simulation_results WHERE mutation_id = ?", (mutation_id,)
+            ).fetchone() is not None
+    
+    def __len__(self) -> int:
+        with self._lock:
+            stored = self._db.execute("SELECT COUNT(*) FROM simulation_results").fetchone()[0]
+        return stored + len(self._unpersisted)
+    
+    def close(self) -> None:
+        with self._lock:
+            if self._db is None:
+                return
+            self._db.close()
+            self._db = None
+            if self._owns_path:
+                try:
+                    os.unlink(self.path)
+                except OSError:
+                    pass
+    
+    def __del__(self):
+        # Interpreter shutdown may have torn down module globals already
+        try:
+            self.close()
+        except Exception:
+            pass
+
+# Rendered visual analyses, keyed by mutation, decision-set content and metrics present
+_VISUALIZATION_CACHE = BoundedTTLCache(max_size=128, ttl_seconds=3600)
+
+def _analyze_decision_set(
+        item: Tuple[str, List[PersonaDecision], bool, datetime.datetime]) -> PersonaDivergenceAnalysis:
+    """Build and score one analysis (top-level so worker processes can unpickle it)"""
+    mutation_id, decisions, quantize_vectors, timestamp = item
+    analysis = PersonaDivergenceAnalysis(
+        mutation_id=mutation_id,
+        decisions=decisions,
+        timestamp=timestamp,
+        quantize_vectors=quantize_vectors
+    )
+    analysis.calculate_all_metrics()
+    return analysis
 
 class DivergenceAnalysisService:
     """Service for analyzing persona divergence in mutation simulations"""
     
-    def __init__(self, vector_embedding_service: Optional[Any] = None):
-        self.analysis_cache: Dict[str, PersonaDivergenceAnalysis] = {}
+    def __init__(self, 
+                vector_embedding_service: Optional[Any] = None, 
+                quantize_vectors: bool = False,
+                embed_batch_size: int = 64,
+                max_concurrent_embeds: int = 8):
+        self.analysis_cache = BoundedTTLCache(max_size=10000, ttl_seconds=3600)
+        # Rationale vectors keyed by decision content, so rebuilt decisions skip re-embedding
+        self.content_cache = BoundedTTLCache(max_size=1000, ttl_seconds=3600)
+        # Metric snapshots keyed by decision-set content, shared across this service's analyses
+        self.metrics_cache = BoundedTTLCache(max_size=256, ttl_seconds=3600)
         self.vector_service = vector_embedding_service
+        self.quantize_vectors = quantize_vectors
+        self.embed_batch_size = embed_batch_size  # Texts per embed_batch request
+        self.max_concurrent_embeds = max_concurrent_embeds  # Max embed_batch requests in flight
     
     async def analyze_persona_decisions(self, 
                                     mutation_id: str,
                                     decisions: List[PersonaDecision]) -> PersonaDivergenceAnalysis:
         """Analyze decisions from multiple personas for a single mutation"""
-        # Generate vectors for explanations if not already present
-        decisions_with_vectors = await self._ensure_vectors(decisions)
+        # Decisions with the same content (e.g. rebuilt from serialized
+        # results) reuse the earlier embeddings instead of calling the vector service
+        content_key = self._decision_content_key(mutation_id, decisions)
+        cached_vectors = self.content_cache.get(content_key)
+        
+        if cached_vectors is None:
+            # Generate vectors for explanations if not already present
+            decisions_with_vectors = await self._ensure_vectors(decisions)
+            self.content_cache[content_key] = tuple(
+                None if d.rationale_vector is None else d.rationale_vector.copy()
+                for d in decisions_with_vectors
+            )
+        else:
+            # Fill the caller's decisions in place, as embedding them would
+            for decision, vector in zip(decisions, cached_vectors):
+                if decision.rationale_vector is None and vector is not None:
+                    decision.rationale_vector = vector.copy()
+            decisions_with_vectors = decisions
         
         # Create analysis object
         analysis = PersonaDivergenceAnalysis(
             mutation_id=mutation_id,
-            decisions=decisions_with_vectors
+            decisions=decisions_with_vectors,
+            quantize_vectors=self.quantize_vectors
         )
         
-        # Calculate all metrics
-        analysis.calculate_all_metrics()
+        # Calculate all metrics (unchanged decision sets hit the metrics cache)
+        analysis.calculate_all_metrics(self.metrics_cache)
         
         # Cache the analysis
         self.analysis_cache[mutation_id] = analysis
         
         return analysis
     
+    def _decision_content_key(self, mutation_id: str, decisions: List[PersonaDecision]) -> bytes:
+        """
+        Digest of a mutation's decisions as seen before embedding
+        Covers everything the analysis derives from (decision hash,
+        explanation, constraint scores, caller-supplied vectors) in decision
+        order, since first appearance breaks cluster ties
+        """
+        digest = hashlib.blake2b(f"{mutation_id}\0".encode(), digest_size=16)
+        digest.update(b"q" if self.quantize_vectors else b"f")
+        for d in decisions:
+            digest.update(d.generate_decision_hash())
+            digest.update(f"{d.persona_id}\0{d.explanation}\0{sorted(d.constraint_scores.items())!r}\0".encode())
+            if d.rationale_vector is not None:
+                digest.update(np.asarray(d.rationale_vector, dtype=np.float64).tobytes())
+            digest.update(b"\1")
+        return digest.digest()
+    
+    def analyze_batch(self, 
+                    items: List[Tuple[str, List[PersonaDecision]]],
+                    max_workers: Optional[int] = None) -> Dict[str, PersonaDivergenceAnalysis]:
+        """
+        Analyze decisions for many mutations across worker processes
+        
+        Metric calculation is CPU-bound, so processes sidestep the GIL.
+        Decisions should already carry their rationale vectors. With the
+        spawn start method (macOS/Windows) callers must invoke this from
+        under an `if __name__ == "__main__":` guard.
+        """
+        max_workers = max_workers or os.cpu_count() or 1
+        
+        # One timestamp for the whole batch rather than a clock read per analysis
+        batch_timestamp = datetime.datetime.now()
+        work = [
+            (mutation_id, decisions, self.quantize_vectors, batch_timestamp) 
+            for mutation_id, decisions in items
+        ]
+        
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            analyses = list(executor.map(
+                _analyze_decision_set, 
+                work, 
+                chunksize=max(1, len(work) // (4 * max_workers))
+            ))
+        
+        # Cache the analyses
+        for analysis in analyses:
+            self.analysis_cache[analysis.mutation_id] = analysis
+        
+        return {analysis.mutation_id: analysis for analysis in analyses}
+    
     async def _ensure_vectors(self, decisions: List[PersonaDecision]) -> List[PersonaDecision]:
         """Ensure all decisions have rationale vectors"""
         if not self.vector_service:
@@ -414,13 +1098,25 @@ class DivergenceAnalysisService:
         if not decisions_to_vectorize:
             return decisions
         
-        # Generate vectors in batches
+        # Generate vectors in fixed-size batches, sent concurrently
         texts = [f"{d.mutated_prompt}\n\nRationale: {d.explanation}" for d in decisions_to_vectorize]
-        vectors = await self.vector_service.embed_batch(texts)
+        batch_size = self.embed_batch_size
+        batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
         
-        # Update decisions with vectors
+        # Use semaphore to limit concurrency
+        semaphore = asyncio.Semaphore(self.max_concurrent_embeds)
+        
+        async def embed_with_semaphore(batch):
+            async with semaphore:
+                return await self.vector_service.embed_batch(batch)
+        
+        # gather preserves batch order, so vectors line up with their decisions
+        batch_vectors = await asyncio.gather(*[embed_with_semaphore(b) for b in batches])
+        vectors = [vector for batch in batch_vectors for vector in batch]
+        
+        # Update decisions with vectors, stored as compact float32 arrays
         for decision, vector in zip(decisions_to_vectorize, vectors):
-            decision.rationale_vector = vector
+            decision.rationale_vector = np.asarray(vector, dtype=np.float32)
         
         return decisions
     
@@ -441,12 +1137,24 @@ class DivergenceAnalysisService:
         if not analyses:
             return {"error": "No analyses found for the requested mutations"}
         
-        # Collect metrics across mutations
-        metrics_by_type = defaultdict(list)
+        # Collect metrics across mutations into a metric type x mutation
+        # matrix, NaN where a mutation lacks a metric
+        metric_types = list(dict.fromkeys(t for analysis in analyses for t in analysis.metrics))
+        type_index = {metric_type: row for row, metric_type in enumerate(metric_types)}
+        metric_values = np.full((len(metric_types), len(analyses)), np.nan)
         
-        for analysis in analyses:
+        for col, analysis in enumerate(analyses):
             for metric_type, metric in analysis.metrics.items():
-                metrics_by_type[metric_type].append((analysis.mutation_id, metric.value))
+                metric_values[type_index[metric_type], col] = metric.value
+        
+        # Every statistic is one reduction over the whole matrix; each row
+        # has at least one value, so no all-NaN slices occur
+        averages = np.nanmean(metric_values, axis=1)
+        minimums = np.nanmin(metric_values, axis=1)
+        maximums = np.nanmax(metric_values, axis=1)
+        std_devs = np.nanstd(metric_values, axis=1)
+        highest = np.nanargmax(metric_values, axis=1)
+        lowest = np.nanargmin(metric_values, axis=1)
         
         # Generate comparison report
         comparison = {
@@ -454,26 +1162,22 @@ class DivergenceAnalysisService:
             "metrics_summary": {}
         }
         
-        for metric_type, values in metrics_by_type.items():
-            mutation_ids, metric_values = zip(*values)
-            
+        for row, metric_type in enumerate(metric_types):
             comparison["metrics_summary"][metric_type.name] = {
-                "average": np.mean(metric_values),
-                "min": np.min(metric_values),
-                "max": np.max(metric_values),
-                "std_dev": np.std(metric_values),
-                "highest_mutation": mutation_ids[np.argmax(metric_values)],
-                "lowest_mutation": mutation_ids[np.argmin(metric_values)]
+                "average": averages[row],
+                "min": minimums[row],
+                "max": maximums[row],
+                "std_dev": std_devs[row],
+                "highest_mutation": analyses[highest[row]].mutation_id,
+                "lowest_mutation": analyses[lowest[row]].mutation_id
             }
         
         # Generate top-level summary
-        if DivergenceMetricType.ENTROPY in metrics_by_type:
-            _, entropy_values = zip(*metrics_by_type[DivergenceMetricType.ENTROPY])
-            comparison["average_entropy"] = np.mean(entropy_values)
+        if DivergenceMetricType.ENTROPY in type_index:
+            comparison["average_entropy"] = averages[type_index[DivergenceMetricType.ENTROPY]]
         
-        if DivergenceMetricType.DECISION_AGREEMENT in metrics_by_type:
-            _, agreement_values = zip(*metrics_by_type[DivergenceMetricType.DECISION_AGREEMENT])
-            comparison["average_agreement"] = np.mean(agreement_values)
+        if DivergenceMetricType.DECISION_AGREEMENT in type_index:
+            comparison["average_agreement"] = averages[type_index[DivergenceMetricType.DECISION_AGREEMENT]]
         
         return comparison
 
@@ -484,12 +1188,18 @@ class PersonaReplaySimulator:
                 replay_engine: MutationReplayEngine,
                 personas: Dict[str, Persona],
                 divergence_service: DivergenceAnalysisService,
-                vector_service: Optional[Any] = None):
+                vector_service: Optional[Any] = None,
+                max_concurrent_simulations: int = 8,
+                result_store_path: Optional[str] = None,
+                max_hot_results: int = 512):
         self.replay_engine = replay_engine
         self.personas = personas
         self.divergence_service = divergence_service
         self.vector_service = vector_service
-        self.simulation_results: Dict[str, Dict[str, Any]] = {}
+        self.max_concurrent_simulations = max_concurrent_simulations  # Max mutations simulated at once
+        # Results and their decision objects per mutation, on disk (a temporary
+        # file unless result_store_path is given) with a hot front
+        self.simulation_results = SimulationResultStore(result_store_path, max_hot=max_hot_results)
     
     async def simulate_with_personas(self, 
                                   mutation_trace: MutationTrace,
@@ -504,10 +1214,7 @@ class PersonaReplaySimulator:
         if not selected_personas:
             return {"error": "No valid personas specified"}
         
-        # Simulate with each persona
-        persona_decisions = []
-        simulation_tasks = []
-        
+        persona_contexts = []
         for persona in selected_personas:
             # Create a specialized context for this persona
             persona_context = ExecutionContext(
@@ -516,35 +1223,68 @@ class PersonaReplaySimulator:
                 constraint_set=[],  # Will be populated from the trace
                 parameters={"persona": persona.to_dict()}
             )
-            
-            # Add the simulation task
-            task = self.replay_engine.replay_trace_with_persona(
-                trace_id=mutation_trace.mutation_id,
-                persona=persona,
-                context=persona_context
+            persona_contexts.append((persona, persona_context))
+        
+        # Replay the trace for every persona in one batched call, falling back
+        # to concurrent per-persona replays when the engine can't batch
+        replay_batch = getattr(self.replay_engine, "replay_trace_with_personas_batch", None)
+        if replay_batch is not None:
+            try:
+                results = await replay_batch(mutation_trace.mutation_id, persona_contexts)
+            except Exception as e:
+                results = [e] * len(persona_contexts)
+        else:
+            results = await asyncio.gather(
+                *(self.replay_engine.replay_trace_with_persona(
+                    trace_id=mutation_trace.mutation_id,
+                    persona=persona,
+                    context=persona_context
+                  ) for persona, persona_context in persona_contexts),
+                return_exceptions=True
             )
-            simulation_tasks.append((persona, task))
         
-        # Wait for all simulations to complete
-        for persona, task in simulation_tasks:
+        # Keep persona selection order, which decision clustering relies on
+        # for deterministic tie-breaks
+        replays = []
+        for (persona, _), result in zip(persona_contexts, results):
+            if isinstance(result, BaseException):
+                logger.error("Error simulating with persona %s", persona.name, exc_info=result)
+                continue
+            
             try:
-                result = await task
-                
                 # Extract constraint scores from validation results
                 constraint_scores = {}
                 if result.validation_results and "constraint_details" in result.validation_results:
                     for constraint, passed in result.validation_results["constraint_details"].items():
                         constraint_scores[constraint] = 1.0 if passed else 0.0
-                
-                # Determine confidence based on success and validation
-                confidence = 0.9 if result.success else 0.3
-                if result.validation_results:
-                    # Adjust confidence based on validation results
-                    validation_score = sum(constraint_scores.values()) / max(1, len(constraint_scores))
-                    confidence *= (0.5 + 0.5 * validation_score)  # Scale confidence by validation
-                
+            except Exception:
+                logger.exception("Error simulating with persona %s", persona.name)
+                continue
+            
+            replays.append((persona, result, constraint_scores))
+        
+        # Score every persona's constraints in one [personas x constraints] pass
+        constraint_names = sorted({name for _, _, scores in replays for name in scores})
+        constraint_columns = {name: j for j, name in enumerate(constraint_names)}
+        score_matrix = np.zeros((len(replays), len(constraint_names)))
+        for i, (_, _, scores) in enumerate(replays):
+            for name, score in scores.items():
+                score_matrix[i, constraint_columns[name]] = score
+        constraint_counts = np.array([len(scores) for _, _, scores in replays], dtype=np.float64)
+        validation_scores = score_matrix.sum(axis=1) / np.maximum(constraint_counts, 1)
+        
+        # Confidence follows success, scaled by validation where results were validated
+        succeeded = np.array([bool(result.success) for _, result, _ in replays], dtype=bool)
+        validated = np.array([bool(result.validation_results) for _, result, _ in replays], dtype=bool)
+        confidences = np.where(succeeded, 0.9, 0.3)
+        confidences = np.where(validated, confidences * (0.5 + 0.5 * validation_scores), confidences)
+        
+        # One slot per replay, filled in place; failed slots stay None
+        decision_slots: List[Optional[PersonaDecision]] = [None] * len(replays)
+        for i, ((persona, result, constraint_scores), confidence) in enumerate(zip(replays, confidences.tolist())):
+            try:
                 # Create a decision object
-                decision = PersonaDecision(
+                decision_slots[i] = PersonaDecision(
                     persona_id=persona.name,
                     persona_type=persona.type,
                     mutation_id=mutation_trace.mutation_id,
@@ -559,11 +1299,9 @@ class PersonaReplaySimulator:
                         "execution_metrics": result.execution_metrics
                     }
                 )
-                
-                persona_decisions.append(decision)
-                
-            except Exception as e:
-                print(f"Error simulating with persona {persona.name}: {e}")
+            except Exception:
+                logger.exception("Error simulating with persona %s", persona.name)
+        persona_decisions = [d for d in decision_slots if d is not None]
         
         if not persona_decisions:
             return {"error": "All persona simulations failed"}
@@ -574,44 +1312,75 @@ class PersonaReplaySimulator:
             decisions=persona_decisions
         )
         
-        # Create simulation result
-        simulation_result = {
-            "mutation_id": mutation_trace.mutation_id,
-            "persona_count": len(persona_decisions),
-            "decisions": [d.to_dict() for d in persona_decisions],
-            "divergence_analysis": analysis.to_dict(),
-            "summary": {
-                "entropy": analysis.entropy,
-                "agreement_rate": analysis.agreement_rate,
-                "variant_count": len(analysis.decision_clusters)
-            }
-        }
+        # Create the simulation record
+        record = SimulationRecord(
+            mutation_id=mutation_trace.mutation_id,
+            decisions=persona_decisions,
+            divergence_analysis=analysis.to_dict(),
+            summary=SimulationSummary(
+                entropy=analysis.entropy,
+                agreement_rate=analysis.agreement_rate,
+                variant_count=len(analysis.decision_clusters)
+            )
+        )
         
-        # Store result
-        self.simulation_results[mutation_trace.mutation_id] = simulation_result
+        # Store the record, keeping the decision objects so reports needn't rebuild them
+        await self.simulation_results.set_async(mutation_trace.mutation_id, record)
         
-        return simulation_result
+        return record.to_dict()
     
     async def batch_simulate_mutations(self, 
                                    mutation_ids: List[str], 
                                    persona_ids: Optional[List[str]] = None) -> Dict[str, Any]:
         """Batch simulate multiple mutations with personas"""
-        results = {}
+        unique_mutation_ids = list(dict.fromkeys(mutation_ids))
         
-        for mutation_id in mutation_ids:
+        # Fetch every requested trace up front, in one round trip when the
+        # repository supports bulk lookups
+        trace_repository = self.replay_engine.trace_repository
+        traces: Dict[str, Any] = {}
+        lookup_errors: Dict[str, Exception] = {}
+        get_many = getattr(trace_repository, "get_many", None)
+        if get_many is not None:
             try:
-                # Retrieve the mutation trace
-                trace = self.replay_engine.trace_repository.get(mutation_id)
-                if not trace:
-                    results[mutation_id] = {"error": f"Trace {mutation_id} not found"}
-                    continue
-                
-                # Simulate with personas
-                result = await self.simulate_with_personas(trace, persona_ids)
-                results[mutation_id] = result
-                
+                traces = get_many(unique_mutation_ids)
             except Exception as e:
-                results[mutation_id] = {"error": f"Simulation error: {str(e)}"}
+                lookup_errors = dict.fromkeys(unique_mutation_ids, e)
+        else:
+            for mid in unique_mutation_ids:
+                try:
+                    traces[mid] = trace_repository.get(mid)
+                except Exception as e:
+                    lookup_errors[mid] = e
+        
+        # Use semaphore to limit concurrency
+        semaphore = asyncio.Semaphore(self.max_concurrent_simulations)
+        
+        async def simulate_mutation(mutation_id):
+            async with semaphore:
+                try:
+                    # Take the prefetched mutation trace
+                    if mutation_id in lookup_errors:
+                        raise lookup_errors[mutation_id]
+                    trace = traces.get(mutation_id)
+                    if not trace:
+                        return mutation_id, {"error": f"Trace {mutation_id} not found"}
+                    
+                    # Simulate with personas
+                    return mutation_id, await self.simulate_with_personas(trace, persona_ids)
+                    
+                except Exception as e:
+                    return mutation_id, {"error": f"Simulation error: {str(e)}"}
+        
+        # Keep a bounded pool of simulations in flight, collecting each as it finishes
+        tasks = [asyncio.ensure_future(simulate_mutation(mid)) for mid in unique_mutation_ids]
+        completed_results = {}
+        for completed in asyncio.as_completed(tasks):
+            mutation_id, result = await completed
+            completed_results[mutation_id] = result
+        
+        # Report results in request order
+        results = {mid: completed_results[mid] for mid in unique_mutation_ids}
         
         # Compile aggregate statistics
         successful_simulations = [mid for mid, result in results.items() if "error" not in result]
@@ -635,28 +1404,12 @@ class PersonaReplaySimulator:
         analysis = await self.divergence_service.get_cached_analysis(mutation_id)
         
         if not analysis:
-            if mutation_id not in self.simulation_results:
+            record = self.simulation_results.get(mutation_id)
+            if record is None:
                 return {"error": f"No simulation results found for mutation {mutation_id}"}
             
-            # Recreate the analysis from stored decisions
-            simulation_result = self.simulation_results[mutation_id]
-            decision_dicts = simulation_result.get("decisions", [])
-            
-            # Convert back to PersonaDecision objects
-            decisions = []
-            for d_dict in decision_dicts:
-                decision = PersonaDecision(
-                    persona_id=d_dict["persona_id"],
-                    persona_type=PersonaType[d_dict["persona_type"]],
-                    mutation_id=d_dict["mutation_id"],
-                    original_prompt=d_dict["original_prompt"],
-                    mutated_prompt=d_dict["mutated_prompt"],
-                    confidence=d_dict["confidence"],
-                    explanation=d_dict["explanation"],
-                    constraint_scores=d_dict.get("constraint_scores", {}),
-                    tags=d_dict.get("tags", [])
-                )
-                decisions.append(decision)
+            # Recreate the analysis from the stored decision objects
+            decisions = record.decisions
             
             # Analyze the decisions
             if decisions:
@@ -667,11 +1420,5 @@ class PersonaReplaySimulator:
             else:
                 return {"error": "No decision data available for analysis"}
         
-        # Generate the detailed report
-        report = analysis.detailed_report()
-        
-        # Add visualization if requested
-        if include_visualization and "visualization" not in report:
-            report["visualization"] = analysis.generate_visual_analysis()
-        
-        return report
\ No newline at end of file
+        # Generate the detailed report, with visualization if requested
+        return analysis.detailed_report(include_visualization=include_visualization)
\ No newline at end of file
@@ -41,17 +41,86 @@ class LogParser(ABC):
         """Check if this parser can handle the given log line."""
         return any(pattern.match(log_line) for pattern in cls.format_patterns)
 
+# Compiled patterns shared by every parser that declares the same expression
+_PATTERN_CACHE: Dict[str, re.Pattern] = {}
+
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """Compile a format pattern once, returning the shared compiled object."""
+    compiled = _PATTERN_CACHE.get(pattern)
+    if compiled is None:
+        compiled = _PATTERN_CACHE[pattern] = re.compile(pattern)
+    return compiled
+
 class ParserRegistry:
     """Registry for all available log parsers."""
     
     _parsers: Dict[str, Type[LogParser]] = {}
+    # Each distinct pattern, in order of first registration, with the parsers declaring it
+    _pattern_to_parsers: Dict[re.Pattern, List[Type[LogParser]]] = {}
+    _parser_order: Dict[Type[LogParser], int] = {}  # Registration position of each parser
+    # Multi-pattern hyperscan database over all distinct patterns, built on first scan
+    _scan_database: Optional[Any] = None
+    _scan_ready: bool = False
     
     @classmethod
     def register(cls, parser_class: Type[LogParser]) -> Type[LogParser]:
         """Register a parser class."""
         cls._parsers[parser_class.name] = parser_class
+        cls._rebuild_pattern_index()
         return parser_class
     
+    @classmethod
+    def _rebuild_pattern_index(cls) -> None:
+        """Index parsers by pattern, following registration order."""
+        index: Dict[re.Pattern, List[Type[LogParser]]] = {}
+        order: Dict[Type[LogParser], int] = {}
+        for parser_class in cls._parsers.values():
+            order.setdefault(parser_class, len(order))
+            for pattern in getattr(parser_class, "format_patterns", ()):
+                parsers = index.setdefault(pattern, [])
+                if parser_class not in parsers:
+                    parsers.append(parser_class)
+        cls._pattern_to_parsers = index
+        cls._parser_order = order
+        
+        # The scan database is recompiled lazily for the new pattern set
+        cls._scan_database = None
+        cls._scan_ready = False
+    
+    @classmethod
+    def _build_scan_database(cls) -> None:
+        """Compile all distinct patterns into one hyperscan database, if possible."""
+        cls._scan_ready = True
+        patterns = list(cls._pattern_to_parsers)
+        
+        # Only plain patterns translate directly; flagged ones use Python re
+        if not patterns or any(p.flags & ~re.UNICODE for p in patterns):
+            return
+        
+        try:
+            import hyperscan
+        except ImportError:
+            # hyperscan not available
+            return
+        
+        try:
+            database = hyperscan.Database()
+            database.compile(
+                # Unanchored, matching the resolver's LogParser.can_parse (re.search)
+                expressions=[p.pattern.encode("utf-8") for p in patterns],
+                ids=list(range(len(patterns))),
+                elements=len(patterns),
+                flags=[
+                    hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_ALLOWEMPTY
+                    | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+                ] * len(patterns)
+            )
+        except Exception:
+            # Some pattern uses syntax hyperscan doesn't support; use Python re
+            return
+        
+        cls._scan_database = database
+    
     @classmethod
     def get_parser(cls, name: str) -> Optional[Type[LogParser]]:
         """Get a parser by name."""
@@ -70,11 +139,67 @@ class ParserRegistry:
             if issubclass(parser_class, LogParser):
                 cls.register(parser_class)
     
+    @classmethod
+    def detect_parsers_scan(cls, 
+                            log_line: str, 
+                            parser_classes: Optional[List[Type[LogParser]]] = None) -> List[Type[LogParser]]:
+        """
+        Find every parser whose format patterns occur anywhere in the log line
+        (re.search semantics), in registration order. Uses a single hyperscan
+        pass over all patterns when available, otherwise tries each distinct
+        pattern once. If parser_classes is given, only those parsers (and
+        their patterns) are considered.
+        """
+        if not cls._scan_ready:
+            cls._build_scan_database()
+        
+        if cls._scan_database is not None:
+            pattern_parsers = list(cls._pattern_to_parsers.values())
+            matched_ids = set()
+            
+            def on_match(pattern_id, start, end, flags, context):
+                matched_ids.add(pattern_id)
+            
+            cls._scan_database.scan(log_line.encode("utf-8"), match_event_handler=on_match)
+            matched = [pattern_parsers[i] for i in matched_ids]
+        else:
+            if parser_classes is None:
+                patterns = cls._pattern_to_parsers
+            else:
+                patterns = dict.fromkeys(
+                    pattern for parser_class in parser_classes
+                    for pattern in getattr(parser_class, "format_patterns", ())
+                )
+            matched = [
+                cls._pattern_to_parsers.get(pattern, ()) for pattern in patterns
+                if pattern.search(log_line)
+            ]
+        
+        candidates = {parser_class for parsers in matched for parser_class in parsers}
+        if parser_classes is not None:
+            candidates.intersection_update(parser_classes)
+        return sorted(candidates, key=cls._parser_order.__getitem__)
+    
     @classmethod
     def detect_parser(cls, log_line: str) -> Optional[Type[LogParser]]:
         """Detect the appropriate parser for a log line."""
-        for parser_class in cls._parsers.values():
-            if parser_class.can_parse(log_line):
+        # Parsers using the base can_parse are matched in one pattern scan;
+        # parsers with their own can_parse are still asked individually
+        parser_classes = list(cls._parsers.values())
+        scan_classes = [
+            parser_class for parser_class in parser_classes
+            if parser_class.can_parse.__func__ is LogParser.can_parse.__func__
+        ]
+        if len(scan_classes) == len(parser_classes):
+            matches = cls.detect_parsers_scan(log_line, scan_classes)
+            return matches[0] if matches else None
+        
+        pattern_matches = set(cls.detect_parsers_scan(log_line, scan_classes))
+        for parser_class in parser_classes:
+            if parser_class.can_parse.__func__ is LogParser.can_parse.__func__:
+                if parser_class in pattern_matches:
+                    return parser_class
+            elif parser_class.can_parse(log_line):
                 return parser_class
         return None
 
@@ -83,6 +208,6 @@ def register_parser(name: str, patterns: List[str]):
     """Decorator to register a parser with the registry."""
     def decorator(cls):
         cls.name = name
-        cls.format_patterns = [re.compile(pattern) for pattern in patterns]
+        cls.format_patterns = [_compile_pattern(pattern) for pattern in patterns]
         return ParserRegistry.register(cls)
     return decorator
\ No newline at end of file
@@ -1,20 +1,42 @@
+import mmap
+import os
+from typing import Iterator, List
+
+# Bytes mapped per batch; each batch is extended to the next line break
+LOG_CHUNK_SIZE = 4 * 1024 * 1024
+
+def iter_log_line_batches(filename: str, chunk_size: int = LOG_CHUNK_SIZE) -> Iterator[List[str]]:
+    """Yield the non-blank, stripped lines of a file in chunk-sized batches."""
+    with open(filename, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return  # mmap cannot map an empty file
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = 0
+            while start < size:
+                end = mm.find(b'\n', max(start, min(start + chunk_size, size) - 1))
+                end = size if end == -1 else end + 1
+                # Same line breaks as text-mode iteration (\n, \r\n and \r)
+                text = mm[start:end].decode('utf-8')
+                text = text.replace('\r\n', '\n').replace('\r', '\n')
+                batch = [line.strip() for line in text.split('\n')]
+                yield [line for line in batch if line]
+                start = end
+
 def process_mixed_log_file(filename: str, resolver: ParserResolver):
     """Process a log file with mixed formats."""
     unparseable_lines = []
     stats = {"total": 0, "parsed": 0, "parsers": {}}
+    parser_counts = stats["parsers"]
     
-    with open(filename, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-                
-            stats["total"] += 1
+    for batch in iter_log_line_batches(filename):
+        stats["total"] += len(batch)
+        for line in batch:
             entry, parser_name, confidence = parse_with_confidence(line, resolver)
             
             if entry:
                 stats["parsed"] += 1
-                stats["parsers"][parser_name] = stats["parsers"].get(parser_name, 0) + 1
+                parser_counts[parser_name] = parser_counts.get(parser_name, 0) + 1
                 
                 # Process the parsed entry
                 print(f"[{parser_name}] ({confidence:.2f}) {entry.to_dict()}")
@@ -4,6 +4,12 @@ from enum import Enum
 from datetime import datetime
 import json
 
+try:
+    import orjson
+except ImportError:
+    # orjson not available
+    orjson = None
+
 class ParserResult(Enum):
     SUCCESS = "success"
     PARTIAL = "partial"
@@ -88,4 +94,6 @@ class ParserTrace:
     
     def __str__(self) -> str:
         """String representation of the trace."""
+        if orjson is not None:
+            return orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2).decode()
         return json.dumps(self.to_dict(), indent=2)
\ No newline at end of file
@@ -3,6 +3,9 @@ import uuid
 import logging
 from typing import Dict, List, Optional, Tuple, Type, Set
 
+# Returned in place of a fresh trace when tracing is off; never populated
+_NULL_TRACE = ParserTrace(trace_id="", raw_log="", timestamp=datetime.min)
+
 class DebugLogger:
     """Custom logger for parser debugging."""
     
@@ -72,6 +75,7 @@ class ParserResolver:
                 debug: bool = False, 
                 trace_all: bool = False,
                 min_confidence_threshold: float = 0.6,
+                high_confidence_threshold: float = 0.95,
                 store_traces: bool = False,
                 trace_store_limit: int = 1000):
         self._chains: Dict[str, ParserChainConfig] = {}
@@ -79,9 +83,12 @@ class ParserResolver:
         self.debug = DebugLogger(enabled=debug)
         self.trace_all = trace_all
         self.min_confidence_threshold = min_confidence_threshold
+        self.high_confidence_threshold = high_confidence_threshold  # Stop trying parsers at this confidence
         self.store_traces = store_traces
         self.trace_store: Dict[str, ParserTrace] = {}
         self.trace_store_limit = trace_store_limit
+        # Parsers hold no per-line state, so one instance per class is reused
+        self._parser_instances: Dict[Type[LogParser], LogParser] = {}
         
     def resolve_with_trace(self, 
                          log_line: str, 
@@ -98,15 +105,18 @@ class ParserResolver:
         Returns:
             Tuple of (parsed_entry, trace)
         """
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         # Create a trace if tracing is enabled or forced
         should_trace = self.trace_all or force_trace
-        trace = ParserTrace(
-            trace_id=str(uuid.uuid4()),
-            raw_log=log_line,
-            timestamp=datetime.now()
-        )
+        if should_trace:
+            trace = ParserTrace(
+                trace_id=str(uuid.uuid4()),
+                raw_log=log_line,
+                timestamp=datetime.now()
+            )
+        else:
+            trace = _NULL_TRACE
         
         # Get the chain to use
         chain = None
@@ -121,8 +131,15 @@ class ParserResolver:
         # Track results from all parsers
         successful_results: List[Tuple[str, ParsedLogEntry, float]] = []
         
-        for parser_name in parser_names:
-            parser_class = ParserRegistry.get_parser(parser_name)
+        # Match the chain's format patterns against the line in one scan;
+        # parsers with their own can_parse are still asked individually
+        parser_classes = [ParserRegistry.get_parser(parser_name) for parser_name in parser_names]
+        pattern_matches = set(ParserRegistry.detect_parsers_scan(log_line, [
+            parser_class for parser_class in parser_classes
+            if parser_class and parser_class.can_parse.__func__ is LogParser.can_parse.__func__
+        ]))
+        
+        for parser_name, parser_class in zip(parser_names, parser_classes):
             if not parser_class:
                 if should_trace:
                     trace.add_attempt(ParserAttempt(
@@ -134,11 +151,13 @@ class ParserResolver:
                     ))
                 continue
                 
-            # Create parser instance
-            parser = parser_class()
-            
             # Skip if parser can't handle this log (fast check)
-            if not parser.can_parse(log_line):
+            if parser_class.can_parse.__func__ is LogParser.can_parse.__func__:
+                can_parse = parser_class in pattern_matches
+            else:
+                can_parse = parser_class.can_parse(log_line)
+            
+            if not can_parse:
                 if should_trace:
                     trace.add_attempt(ParserAttempt(
                         parser_name=parser_name,
@@ -148,12 +167,18 @@ class ParserResolver:
                         rejected_reason="Initial pattern match failed"
                     ))
                 continue
+            
+            # Reuse the cached parser instance
+            parser = self._parser_instances.get(parser_class)
+            if parser is None:
+                parser = self._parser_instances[parser_class] = parser_class()
                 
             # Attempt to parse
-            parser_start = time.time()
+            parser_start = time.perf_counter_ns() if should_trace else 0
             try:
                 entry = parser.parse(log_line)
-                parser_duration = (time.time() - parser_start) * 1000  # ms
+                if should_trace:
+                    parser_duration = (time.perf_counter_ns() - parser_start) / 1e6  # ms
                 
                 if entry is None:
                     # Parser declined to parse despite pattern match
@@ -195,10 +220,15 @@ class ParserResolver:
                 # Only consider results with minimum confidence
                 if confidence >= self.min_confidence_threshold:
                     successful_results.append((parser_name, entry, confidence))
+                    
+                    # A near-certain accepted match ends the search unless the
+                    # trace needs every parser's attempt
+                    if confidence >= self.high_confidence_threshold and not should_trace:
+                        break
                 
             except Exception as e:
-                parser_duration = (time.time() - parser_start) * 1000  # ms
                 if should_trace:
+                    parser_duration = (time.perf_counter_ns() - parser_start) / 1e6  # ms
                     trace.add_attempt(ParserAttempt(
                         parser_name=parser_name,
                         result=ParserResult.ERROR,
@@ -243,7 +273,7 @@ class ParserResolver:
         # Update trace with final results
         if should_trace:
             trace.selected_parser = best_parser
-            trace.parsing_time_ms = (time.time() - start_time) * 1000
+            trace.parsing_time_ms = (time.perf_counter_ns() - start_time) / 1e6
             
             # Store the trace if requested
             if self.store_traces:
@@ -262,7 +292,7 @@ class ParserResolver:
             best_entry.parser_metadata = {
                 "parser_name": best_parser,
                 "confidence": best_confidence,
-                "parsing_time_ms": (time.time() - start_time) * 1000
+                "parsing_time_ms": (time.perf_counter_ns() - start_time) / 1e6
             }
             
             # Add trace information if available
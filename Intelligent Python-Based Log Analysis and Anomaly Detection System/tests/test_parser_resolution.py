@@ -0,0 +1,98 @@
+import re
+from pathlib import Path
+from datetime import datetime
+
+PROCESSING = Path(__file__).resolve().parent.parent / "processing"
+
+# The processing snippets share one namespace, each building on the names
+# defined by the ones before it
+SNIPPETS = [
+    "code_snippet_1.py",   # ParserRegistry and register_parser
+    "code_snippet_6.py",   # LogParser with validate/confidence
+    "code_snippet_12.py",  # ParsedLogEntry with parser_metadata
+    "code_snippet_11.py",  # ParserTrace, ParserAttempt, ParserResult
+    "code_snippet_13.py",  # ParserResolver.resolve_with_trace
+]
+
+def load_processing():
+    namespace = {"__name__": "processing_snippets"}
+    for snippet in SNIPPETS:
+        path = PROCESSING / snippet
+        exec(compile(path.read_text(), str(path), "exec"), namespace)
+    return namespace
+
+def make_error_parser(ns):
+    @ns["register_parser"](name="error_word", patterns=[r"ERROR (\w+)"])
+    class ErrorWordParser(ns["LogParser"]):
+        def parse(self, log_line):
+            match = re.search(r"ERROR (\w+)", log_line)
+            if not match:
+                return None
+            return ns["ParsedLogEntry"](
+                timestamp=datetime(2024, 1, 1),
+                level="ERROR",
+                message=log_line,
+                fields={"word": match.group(1)}
+            )
+    return ErrorWordParser
+
+def test_scan_matches_pattern_mid_line():
+    ns = load_processing()
+    parser_class = make_error_parser(ns)
+    
+    assert ns["ParserRegistry"].detect_parsers_scan("2024-01-01 ERROR boom") == [parser_class]
+    assert ns["ParserRegistry"].detect_parsers_scan("2024-01-01 INFO ok") == []
+    # Restricting the scan to a chain leaves out parsers outside it
+    assert ns["ParserRegistry"].detect_parsers_scan("2024-01-01 ERROR boom", []) == []
+
+def test_detect_parser_agrees_with_can_parse():
+    ns = load_processing()
+    parser_class = make_error_parser(ns)
+    
+    @ns["register_parser"](name="custom", patterns=[])
+    class CustomParser(ns["LogParser"]):
+        @classmethod
+        def can_parse(cls, log_line):
+            return log_line.startswith("CUSTOM")
+        
+        def parse(self, log_line):
+            return None
+    
+    assert parser_class.can_parse("2024-01-01 ERROR boom")
+    assert ns["ParserRegistry"].detect_parser("2024-01-01 ERROR boom") is parser_class
+    assert ns["ParserRegistry"].detect_parser("CUSTOM line") is CustomParser
+    assert ns["ParserRegistry"].detect_parser("2024-01-01 INFO ok") is None
+
+def test_resolve_with_trace_parses_unanchored_match():
+    ns = load_processing()
+    make_error_parser(ns)
+    resolver = ns["ParserResolver"](min_confidence_threshold=0.0)
+    
+    entry, trace = resolver.resolve_with_trace("2024-01-01 ERROR boom", force_trace=True)
+    
+    assert entry is not None
+    assert entry.fields["word"] == "boom"
+    assert trace.selected_parser == "error_word"
+    assert [a.result for a in trace.attempts] == [ns["ParserResult"].SUCCESS]
+
+def make_scored_parser(ns, name, score):
+    @ns["register_parser"](name=name, patterns=[r"boom"])
+    class ScoredParser(ns["LogParser"]):
+        def parse(self, log_line):
+            return ns["ParsedLogEntry"](timestamp=datetime(2024, 1, 1), message=log_line)
+        
+        def confidence(self, log_line, entry):
+            return score
+    return ScoredParser
+
+def test_rejected_high_confidence_result_does_not_end_search():
+    ns = load_processing()
+    make_scored_parser(ns, "likely", 0.97)
+    make_scored_parser(ns, "certain", 0.99)
+    # "likely" clears the early-exit threshold but not the minimum
+    resolver = ns["ParserResolver"](min_confidence_threshold=0.98)
+    
+    entry, _ = resolver.resolve_with_trace("ERROR boom")
+    
+    assert entry is not None
+    assert entry.parser_metadata["parser_name"] == "certain"